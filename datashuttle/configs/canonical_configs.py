@@ -4,9 +4,8 @@ format of the configs class. This is clearly defined
 as configs can be provided from file or input dynamically
 and so careful checks must be done.
 
-If adding a new config, first add the key to
-get_canonical_configs() and type to
-get_canonical_configs()
+If adding a new config, add the key and its
+type to _CANONICAL_CONFIGS.
 """
 
 from __future__ import annotations
@@ -23,27 +22,28 @@ from typing import (
 if TYPE_CHECKING:
     from datashuttle.configs.config_class import Configs
 from pathlib import Path
+from types import MappingProxyType
 
 import typeguard
 
 from datashuttle.utils import folders, utils
 from datashuttle.utils.custom_exceptions import ConfigError
 
-
-def get_canonical_configs() -> dict:
-    """
-    The only permitted types for DataShuttle
-    config values.
-    """
-    canonical_configs = {
+# The only permitted types for DataShuttle config values,
+# in the order the configs are saved to file.
+_CANONICAL_CONFIGS = MappingProxyType(
+    {
         "local_path": Union[str, Path],
         "central_path": Optional[Union[str, Path]],
         "connection_method": Optional[Literal["ssh", "local_filesystem"]],
         "central_host_id": Optional[str],
         "central_host_username": Optional[str],
     }
+)
+
+_CANONICAL_CONFIG_KEYS = tuple(_CANONICAL_CONFIGS)
 
-    return canonical_configs
+_KEYS_STR_ON_FILE_BUT_PATH_IN_CLASS = ("local_path", "central_path")
 
 
 def get_datatypes() -> List[str]:
@@ -54,16 +54,13 @@ def get_datatypes() -> List[str]:
     return ["ephys", "behav", "funcimg", "anat"]
 
 
-def keys_str_on_file_but_path_in_class() -> list[str]:
+def keys_str_on_file_but_path_in_class() -> tuple[str, ...]:
     """
     All configs which are paths are converted to pathlib.Path
-    objects on load. This list indicates which config entries
+    objects on load. This indicates which config entries
     are to be converted to Path.
     """
-    return [
-        "local_path",
-        "central_path",
-    ]
+    return _KEYS_STR_ON_FILE_BUT_PATH_IN_CLASS
 
 
 # -----------------------------------------------------------------------------
@@ -85,22 +82,26 @@ def check_dict_values_raise_on_fail(config_dict: Configs) -> None:
 
     config_dict : datashuttle config UserDict
     """
-    canonical_dict = get_canonical_configs()
-
-    for key in canonical_dict.keys():
-        if key not in config_dict.keys():
+    # In the usual case the keys match the canonical keys
+    # exactly, so there is no missing or invalid key to find.
+    config_keys = tuple(config_dict)
+    keys_match = config_keys == _CANONICAL_CONFIG_KEYS
+
+    if not keys_match:
+        # Report all missing and invalid keys together
+        key_errors = [
+            f"Loading Failed. The key '{key}' was not found in the config."
+            for key in _CANONICAL_CONFIG_KEYS
+            if key not in config_dict
+        ] + [
+            f"The config contains an invalid key: {key}."
+            for key in config_keys
+            if key not in _CANONICAL_CONFIGS
+        ]
+
+        if key_errors:
             utils.log_and_raise_error(
-                f"Loading Failed. The key '{key}' was not "
-                f"found in the config. "
-                f"Config file was not updated.",
-                ConfigError,
-            )
-
-    for key in config_dict.keys():
-        if key not in canonical_dict.keys():
-            utils.log_and_raise_error(
-                f"The config contains an invalid key: {key}. "
-                f"Config file was not updated.",
+                "\n".join(key_errors) + "\nConfig file was not updated.",
                 ConfigError,
             )
 
@@ -108,10 +109,10 @@ def check_dict_values_raise_on_fail(config_dict: Configs) -> None:
 
     raise_on_bad_local_only_project_configs(config_dict)
 
-    if list(config_dict.keys()) != list(canonical_dict.keys()):
+    if not keys_match:
         utils.log_and_raise_error(
             f"New config keys are in the wrong order. The"
-            f" order should be: {canonical_dict.keys()}.",
+            f" order should be: {_CANONICAL_CONFIG_KEYS}.",
             ConfigError,
         )
 
@@ -155,22 +156,23 @@ def raise_on_bad_local_only_project_configs(config_dict: Configs) -> None:
     should be set and not the other. Either both are set ('full' project) or
     neither are ('local only' project). Check this assumption here.
     """
-    params_are_none = local_only_configs_are_none(config_dict)
+    central_path_is_none, connection_method_is_none = (
+        local_only_configs_are_none(config_dict)
+    )
 
-    if any(params_are_none):
-        if not all(params_are_none):
-            utils.log_and_raise_error(
-                "Either both `central_path` and `connection_method` must be set, "
-                "or must both be `None` (for local-project mode).",
-                ConfigError,
-            )
+    if central_path_is_none != connection_method_is_none:
+        utils.log_and_raise_error(
+            "Either both `central_path` and `connection_method` must be set, "
+            "or must both be `None` (for local-project mode).",
+            ConfigError,
+        )
 
 
-def local_only_configs_are_none(config_dict: Configs) -> list[bool]:
-    return [
-        config_dict[key] is None
-        for key in ["central_path", "connection_method"]
-    ]
+def local_only_configs_are_none(config_dict: Configs) -> tuple[bool, bool]:
+    return (
+        config_dict["central_path"] is None,
+        config_dict["connection_method"] is None,
+    )
 
 
 def raise_on_bad_path_syntax(
@@ -181,7 +183,7 @@ def raise_on_bad_path_syntax(
     Error if some common, unsupported patterns are observed
     (e.g. ~, .) for path.
     """
-    if path_name[0] == "~":
+    if path_name.startswith("~"):
         utils.log_and_raise_error(
             f"{path_type} must contain the full folder path "
             "with no ~ syntax.",
@@ -201,22 +203,27 @@ def raise_on_bad_path_syntax(
 def check_config_types(config_dict: Configs) -> None:
     """
     Check the type of passed configs matches the canonical types.
+    All incorrectly typed configs are reported in a single error.
     """
-    required_types = get_canonical_configs()
+    type_errors = []
 
-    for key in config_dict.keys():
+    for key in config_dict:
 
-        expected_type = required_types[key]
+        expected_type = _CANONICAL_CONFIGS[key]
         try:
             typeguard.check_type(config_dict[key], expected_type)
         except typeguard.TypeCheckError:
-            utils.log_and_raise_error(
+            type_errors.append(
                 f"The type of the value at '{key}' is incorrect, "
-                f"it must be {expected_type}. "
-                f"Config file was not updated.",
-                ConfigError,
+                f"it must be {expected_type}."
             )
 
+    if type_errors:
+        utils.log_and_raise_error(
+            "\n".join(type_errors) + "\nConfig file was not updated.",
+            ConfigError,
+        )
+
 
 # -----------------------------------------------------------------------------
 # Persistent settings
@@ -1,19 +1,53 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from datashuttle.utils.custom_types import TopLevelFolder
 
 from datashuttle.utils.folder_class import Folder
 
+# Keywords that may be passed as `sub_names` or `ses_names` for data
+# transfer (e.g. "all_sub") but are not subject or session names, so
+# are not formatted or validated as names.
+RESERVED_KEYWORDS_SET = frozenset(
+    (
+        "all_sub",
+        "all_non_sub",
+        "all_ses",
+        "all_non_ses",
+        "all_datatype",
+        "all_non_datatype",
+    )
+)
+
+_TOP_LEVEL_FOLDERS: tuple[TopLevelFolder, ...] = ("rawdata", "derivatives")
 
-def get_datatype_folders() -> dict:
+# For checking a top-level folder name without building a new list.
+TOP_LEVEL_FOLDERS_SET = frozenset(_TOP_LEVEL_FOLDERS)
+
+# (key, name, level) of each canonical datatype folder,
+# see `get_datatype_folders()`.
+_DATATYPE_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("ephys", "ephys", "ses"),
+    ("behav", "behav", "ses"),
+    ("funcimg", "funcimg", "ses"),
+    ("anat", "anat", "ses"),
+)
+
+
+@lru_cache(maxsize=None)
+def get_datatype_folders() -> MappingProxyType[str, Folder]:
     """
     This function holds the canonical folders
     managed by datashuttle.
 
+    The result is built once and shared between callers
+    as a read-only view (copy it with `dict()` to modify).
+
     Parameters
     ----------
 
@@ -22,9 +56,9 @@ def get_datatype_folders() -> dict:
     Other Parameters
     ----------------
 
-    When adding a new folder, the
-    key should be the canonical key used to refer
-    to the datatype in datashuttle and SWC-BIDs.
+    When adding a new folder, add a (key, name, level) entry
+    to `_DATATYPE_SPEC`. The key should be the canonical key used
+    to refer to the datatype in datashuttle and SWC-BIDs.
 
     The value is a Folder() class instance with
     the required fields
@@ -36,73 +70,63 @@ def get_datatype_folders() -> dict:
 
     level : "sub" or "ses", level to make the folder at.
     """
-    return {
-        "ephys": Folder(
-            name="ephys",
-            level="ses",
-        ),
-        "behav": Folder(
-            name="behav",
-            level="ses",
-        ),
-        "funcimg": Folder(
-            name="funcimg",
-            level="ses",
-        ),
-        "anat": Folder(
-            name="anat",
-            level="ses",
-        ),
-    }
-
-
-def get_non_sub_names() -> List[str]:
-    """
-    Get all arguments that are not allowed at the
-    subject level for data transfer, i.e. as sub_names
-    """
-    return [
-        "all_ses",
-        "all_non_ses",
-        "all_datatype",
-        "all_non_datatype",
-    ]
+    return MappingProxyType(
+        {
+            key: Folder(name=name, level=level)
+            for key, name, level in _DATATYPE_SPEC
+        }
+    )
 
 
-def get_non_ses_names() -> List[str]:
+@lru_cache(maxsize=None)
+def get_datatype_folders_by_level() -> dict[str, tuple[Folder, ...]]:
     """
-    Get all arguments that are not allowed at the
-    session level for data transfer, i.e. as ses_names
+    The canonical datatype folders (see `get_datatype_folders()`)
+    partitioned by the level they are made at, so callers can
+    take the "sub" or "ses" level folders directly rather than
+    filtering all datatype folders by level.
     """
-    return [
-        "all_sub",
-        "all_non_sub",
-        "all_datatype",
-        "all_non_datatype",
-    ]
+    by_level: dict[str, list[Folder]] = {"sub": [], "ses": []}
+
+    for folder in get_datatype_folders().values():
+        by_level[folder.level].append(folder)
+
+    return {level: tuple(folders) for level, folders in by_level.items()}
 
 
-def canonical_reserved_keywords() -> List[str]:
+@lru_cache(maxsize=None)
+def get_datatype_folders_items() -> tuple[tuple[str, Folder], ...]:
     """
-    Key keyword arguments that are passed to `sub_names` or
-    `ses_names` but that we
+    The (key, Folder) pairs of the canonical datatype folders
+    (see `get_datatype_folders()`) as a tuple, built once
+    and shared between callers.
     """
-    return get_non_sub_names() + get_non_ses_names()
+    return tuple(get_datatype_folders().items())
 
 
-def get_top_level_folders() -> List[TopLevelFolder]:
-    return ["rawdata", "derivatives"]
+def get_top_level_folders() -> tuple[TopLevelFolder, ...]:
+    return _TOP_LEVEL_FOLDERS
 
 
+@lru_cache(maxsize=1)
 def get_datashuttle_path() -> Path:
     """
     Get the datashuttle path where all project
     configs are stored.
+
+    The home folder does not change during a session, so the
+    result is cached. Call `get_datashuttle_path.cache_clear()`
+    if `HOME` is changed (e.g. in tests).
     """
     return Path.home() / ".datashuttle"
 
 
-def get_project_datashuttle_path(project_name: str) -> Tuple[Path, Path]:
+class ProjectDatashuttlePaths(NamedTuple):
+    base_path: Path
+    temp_logs_path: Path
+
+
+def get_project_datashuttle_path(project_name: str) -> ProjectDatashuttlePaths:
     """
     Get the datashuttle path for the project,
     where configuration files are stored.
@@ -113,6 +137,5 @@ def get_project_datashuttle_path(project_name: str) -> Tuple[Path, Path]:
     folder.
     """
     base_path = get_datashuttle_path() / project_name
-    temp_logs_path = base_path / "temp_logs"
 
-    return base_path, temp_logs_path
+    return ProjectDatashuttlePaths(base_path, base_path / "temp_logs")
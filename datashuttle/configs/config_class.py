@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional, Union, cast
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 
 if TYPE_CHECKING:
-    from collections.abc import ItemsView, KeysView, ValuesView
+    from collections.abc import ItemsView, Iterable, KeysView, ValuesView
 
     from datashuttle.utils.custom_types import (
         OverwriteExistingFiles,
         TopLevelFolder,
     )
+    from datashuttle.utils.folder_class import Folder
 
 import copy
+import os
+import re
 from collections import UserDict
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -23,6 +27,19 @@ from datashuttle.configs import (
 )
 from datashuttle.utils import folders, utils
 
+# The config key holding the project path for each base.
+_BASE_PATH_KEYS = {"local": "local_path", "central": "central_path"}
+
+# Formats accepted by rclone's `--max-age`: a duration with units
+# (e.g. "2d", "1h30m", "1.5w"), a plain number of seconds, or a date
+# (e.g. "2024-01-31", "2024-01-31T12:00:00" or with a timezone).
+RCLONE_MAX_AGE_REGEXP = re.compile(
+    r"(\d+(\.\d+)?(ms|s|m|h|d|w|M|y))+"
+    r"|\d+(\.\d+)?"
+    r"|\d{4}-\d{2}-\d{2}"
+    r"([T ]\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?)?"
+)
+
 
 class Configs(UserDict):
     """
@@ -51,6 +68,9 @@ class Configs(UserDict):
     def __init__(
         self, project_name: str, file_path: Path, input_dict: Union[dict, None]
     ) -> None:
+        # Must exist before the dict is filled, see `__setitem__()`.
+        self._base_folders: Dict[Tuple[str, str], Path] = {}
+
         super(Configs, self).__init__(input_dict)
 
         self.project_name = project_name
@@ -61,6 +81,10 @@ class Configs(UserDict):
         self.ssh_key_path: Path
         self.project_metadata_path: Path
 
+    def __setitem__(self, key, value) -> None:
+        super(Configs, self).__setitem__(key, value)
+        self._base_folders.clear()
+
     def setup_after_load(self) -> None:
         load_configs.convert_str_and_pathlib_paths(self, "str_to_path")
         self.ensure_local_and_central_path_end_in_project_name()
@@ -113,18 +137,31 @@ class Configs(UserDict):
         with open(self.file_path, "w") as config_file:
             yaml.dump(cfg_to_save, config_file, sort_keys=False)
 
+        read_config_file.cache_clear()
+
     def load_from_file(self) -> None:
         """
         Load a config dict saved at .yaml file. Note this will
         not automatically check the configs are valid, this
         requires calling self.check_dict_values_raise_on_fail()
+
+        The parsed file is cached until it is modified
+        (see `read_config_file()`).
         """
-        with open(self.file_path, "r") as config_file:
-            config_dict = yaml.full_load(config_file)
+        file_stat = os.stat(self.file_path)
+
+        config_dict = copy.deepcopy(
+            read_config_file(
+                Path(self.file_path).as_posix(),
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+            )
+        )
 
         load_configs.convert_str_and_pathlib_paths(config_dict, "str_to_path")
 
         self.data = config_dict
+        self._base_folders.clear()
 
     # -------------------------------------------------------------------------
     # Utils
@@ -144,25 +181,25 @@ class Configs(UserDict):
         Parameters
         ----------
 
-        base: "local", "central" or "datashuttle"
+        base: "local" or "central"
 
         sub_folders: a list (or string for 1) of
             folder names to be joined into a path.
             If file included, must be last entry (with ext).
         """
-        if isinstance(sub_folders, list):
-            sub_folders_str = "/".join(sub_folders)
+        if isinstance(sub_folders, str):
+            sub_folders_str = sub_folders
         else:
-            sub_folders_str = cast(str, sub_folders)
-
-        sub_folders_path = Path(sub_folders_str)
+            sub_folders_str = "/".join(sub_folders)
 
         base_folder = self.get_base_folder(base, top_level_folder)
 
-        if utils.path_starts_with_base_folder(base_folder, sub_folders_path):
-            joined_path = sub_folders_path
+        # Compare the strings directly so that, in the common case of a
+        # relative sub-path, only the joined path is constructed.
+        if sub_folders_str.startswith(base_folder.as_posix()):
+            joined_path = Path(sub_folders_str)
         else:
-            joined_path = base_folder / sub_folders_path
+            joined_path = base_folder / sub_folders_str
 
         return joined_path
 
@@ -177,15 +214,25 @@ class Configs(UserDict):
         Parameters
         ----------
 
-        base : base path, "local", "central" or "datashuttle"
+        base : base path, "local" or "central"
 
+        The result is cached until the configs are changed.
         """
-        if base == "local":
-            base_folder = self["local_path"] / top_level_folder
-        elif base == "central":
-            base_folder = self["central_path"] / top_level_folder
+        key = (base, top_level_folder)
+
+        if key not in self._base_folders:
+            if base not in _BASE_PATH_KEYS:
+                utils.log_and_raise_error(
+                    f"`base` not recognised, must be one of: "
+                    f"{list(_BASE_PATH_KEYS)}",
+                    ValueError,
+                )
+
+            self._base_folders[key] = (
+                self[_BASE_PATH_KEYS[base]] / top_level_folder
+            )
 
-        return base_folder
+        return self._base_folders[key]
 
     def get_rclone_config_name(
         self, connection_method: Optional[str] = None
@@ -201,7 +248,10 @@ class Configs(UserDict):
         return f"central_{self.project_name}_{connection_method}"
 
     def make_rclone_transfer_options(
-        self, overwrite_existing_files: OverwriteExistingFiles, dry_run: bool
+        self,
+        overwrite_existing_files: OverwriteExistingFiles,
+        dry_run: bool,
+        max_age: Optional[str] = None,
     ) -> Dict:
         """
         This function originally collected the relevant arguments
@@ -219,11 +269,22 @@ class Configs(UserDict):
                 ValueError,
             )
 
+        if max_age is not None and not re.fullmatch(
+            RCLONE_MAX_AGE_REGEXP, max_age
+        ):
+            utils.log_and_raise_error(
+                f"`max_age` '{max_age}' not recognised, must be a duration "
+                "(e.g. '12h', '2d' or '1h30m') or a date "
+                "(e.g. '2024-01-31' or '2024-01-31T12:00:00').",
+                ValueError,
+            )
+
         return {
             "overwrite_existing_files": overwrite_existing_files,
             "show_transfer_progress": True,
             "transfer_verbosity": "vv",
             "dry_run": dry_run,
+            "max_age": max_age,
         }
 
     def init_paths(self) -> None:
@@ -251,27 +312,23 @@ class Configs(UserDict):
 
     def get_datatype_as_dict_items(
         self, datatype: Union[str, list]
-    ) -> Union[ItemsView, zip]:
+    ) -> Iterable[Tuple[str, Folder]]:
         """
         Get the .items() structure of the datatype, either all of
-        the canonical datatypes or as a single item.
+        the canonical datatypes or as a single item. The
+        (key, folder) pairs are generated as they are iterated.
         """
-        if isinstance(datatype, str):
-            datatype = [datatype]
-
-        items: Union[ItemsView, zip]
-
         datatype_folders = canonical_folders.get_datatype_folders()
 
+        if isinstance(datatype, str):
+            if datatype == "all":
+                return canonical_folders.get_datatype_folders_items()
+            return ((datatype, datatype_folders[datatype]),)
+
         if "all" in datatype:
-            items = datatype_folders.items()
-        else:
-            items = zip(
-                datatype,
-                [datatype_folders[key] for key in datatype],
-            )
+            return canonical_folders.get_datatype_folders_items()
 
-        return items
+        return ((key, datatype_folders[key]) for key in datatype)
 
     def is_local_project(self):
         """
@@ -283,3 +340,15 @@ class Configs(UserDict):
         params_are_none = canonical_configs.local_only_configs_are_none(self)
 
         return all(params_are_none)
+
+
+@lru_cache(maxsize=8)
+def read_config_file(file_path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse the config .yaml file. The file modification time
+    and size are passed only so that the cached result is not
+    used once the file has changed. The returned dict is shared
+    between calls and must be copied before it is changed.
+    """
+    with open(file_path, "r") as config_file:
+        return yaml.full_load(config_file)
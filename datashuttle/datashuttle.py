@@ -24,7 +24,6 @@ if TYPE_CHECKING:
         TopLevelFolder,
     )
 
-import paramiko
 import yaml
 
 from datashuttle.configs import (
@@ -110,7 +109,9 @@ class DataShuttle:
             self._temp_log_path,
         ) = canonical_folders.get_project_datashuttle_path(self.project_name)
 
-        folders.create_folders([self._datashuttle_path, self._temp_log_path])
+        # `_temp_log_path` is within `_datashuttle_path`, so
+        # making it (with parents) creates both folders.
+        folders.create_folders(self._temp_log_path)
 
         self._config_path = self._datashuttle_path / "config.yaml"
 
@@ -125,8 +126,6 @@ class DataShuttle:
 
         if self.cfg:
             self._set_attributes_after_config_load()
-        else:
-            rclone.prompt_rclone_download_if_does_not_exist()
 
     def _set_attributes_after_config_load(self) -> None:
         """
@@ -334,6 +333,7 @@ class DataShuttle:
         datatype: Union[List[str], str] = "all",
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
         init_log: bool = True,
     ) -> None:
         """
@@ -375,6 +375,12 @@ class DataShuttle:
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
 
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
+
         init_log :
             (Optional). Whether to handle logging. This should
             always be True, unless logger is handled elsewhere
@@ -394,6 +400,7 @@ class DataShuttle:
             datatype,
             overwrite_existing_files,
             dry_run,
+            max_age,
             log=True,
         )
 
@@ -410,6 +417,7 @@ class DataShuttle:
         datatype: Union[List[str], str] = "all",
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
         init_log: bool = True,
     ) -> None:
         """
@@ -449,6 +457,12 @@ class DataShuttle:
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
 
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
+
         init_log :
             (Optional). Whether to handle logging. This should
             always be True, unless logger is handled elsewhere
@@ -468,6 +482,7 @@ class DataShuttle:
             datatype,
             overwrite_existing_files,
             dry_run,
+            max_age,
             log=True,
         )
 
@@ -485,6 +500,7 @@ class DataShuttle:
         self,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ):
         """
         Upload files in the `rawdata` top level folder.
@@ -503,12 +519,19 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._transfer_top_level_folder(
             "upload",
             "rawdata",
             overwrite_existing_files=overwrite_existing_files,
             dry_run=dry_run,
+            max_age=max_age,
         )
 
     @check_configs_set
@@ -517,6 +540,7 @@ class DataShuttle:
         self,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ):
         """
         Upload files in the `derivatives` top level folder.
@@ -535,12 +559,19 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._transfer_top_level_folder(
             "upload",
             "derivatives",
             overwrite_existing_files=overwrite_existing_files,
             dry_run=dry_run,
+            max_age=max_age,
         )
 
     @check_configs_set
@@ -549,6 +580,7 @@ class DataShuttle:
         self,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ):
         """
         Download files in the `rawdata` top level folder.
@@ -567,12 +599,19 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._transfer_top_level_folder(
             "download",
             "rawdata",
             overwrite_existing_files=overwrite_existing_files,
             dry_run=dry_run,
+            max_age=max_age,
         )
 
     @check_configs_set
@@ -581,6 +620,7 @@ class DataShuttle:
         self,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ):
         """
         Download files in the `derivatives` top level folder.
@@ -599,12 +639,19 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._transfer_top_level_folder(
             "download",
             "derivatives",
             overwrite_existing_files=overwrite_existing_files,
             dry_run=dry_run,
+            max_age=max_age,
         )
 
     @check_configs_set
@@ -613,6 +660,7 @@ class DataShuttle:
         self,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ) -> None:
         """
         Upload the entire project (from 'local' to 'central'),
@@ -633,10 +681,16 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._start_log("upload-entire-project", local_vars=locals())
         self._transfer_entire_project(
-            "upload", overwrite_existing_files, dry_run
+            "upload", overwrite_existing_files, dry_run, max_age
         )
         ds_logger.close_log_filehandler()
 
@@ -646,6 +700,7 @@ class DataShuttle:
         self,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ) -> None:
         """
         Download the entire project (from 'central' to 'local'),
@@ -666,10 +721,16 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._start_log("download-entire-project", local_vars=locals())
         self._transfer_entire_project(
-            "download", overwrite_existing_files, dry_run
+            "download", overwrite_existing_files, dry_run, max_age
         )
         ds_logger.close_log_filehandler()
 
@@ -680,6 +741,7 @@ class DataShuttle:
         filepath: Union[str, Path],
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ) -> None:
         """
         Upload a specific file or folder. If transferring
@@ -706,11 +768,17 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._start_log("upload-specific-folder-or-file", local_vars=locals())
 
         self._transfer_specific_file_or_folder(
-            "upload", filepath, overwrite_existing_files, dry_run
+            "upload", filepath, overwrite_existing_files, dry_run, max_age
         )
 
         ds_logger.close_log_filehandler()
@@ -722,6 +790,7 @@ class DataShuttle:
         filepath: Union[str, Path],
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
     ) -> None:
         """
         Download a specific file or folder. If transferring
@@ -748,13 +817,19 @@ class DataShuttle:
             perform a dry-run of transfer. This will output as if file
             transfer was taking place, but no files will be moved. Useful
             to check which files will be moved on data transfer.
+
+        max_age :
+            (Optional). If set, only files modified within this age
+            are transferred, e.g. "12h", "2d" or a date "2024-01-31"
+            (see rclone's `--max-age`). By default, all files
+            are considered.
         """
         self._start_log(
             "download-specific-folder-or-file", local_vars=locals()
         )
 
         self._transfer_specific_file_or_folder(
-            "download", filepath, overwrite_existing_files, dry_run
+            "download", filepath, overwrite_existing_files, dry_run, max_age
         )
 
         ds_logger.close_log_filehandler()
@@ -765,6 +840,7 @@ class DataShuttle:
         top_level_folder: TopLevelFolder,
         overwrite_existing_files: OverwriteExistingFiles = "never",
         dry_run: bool = False,
+        max_age: Optional[str] = None,
         init_log: bool = True,
     ):
         """
@@ -789,6 +865,7 @@ class DataShuttle:
             "all",
             overwrite_existing_files=overwrite_existing_files,
             dry_run=dry_run,
+            max_age=max_age,
             init_log=False,
         )
 
@@ -796,7 +873,12 @@ class DataShuttle:
             ds_logger.close_log_filehandler()
 
     def _transfer_specific_file_or_folder(
-        self, upload_or_download, filepath, overwrite_existing_files, dry_run
+        self,
+        upload_or_download,
+        filepath,
+        overwrite_existing_files,
+        dry_run,
+        max_age=None,
     ):
         """
         Core function for upload/download_specific_folder_or_file().
@@ -809,31 +891,30 @@ class DataShuttle:
         else:
             base_path = self.cfg["central_path"]
 
-        if not utils.path_starts_with_base_folder(base_path, filepath):
+        try:
+            processed_filepath = filepath.relative_to(base_path)
+        except ValueError:
             utils.log_and_raise_error(
                 "Transfer failed. "
                 "Must pass the full filepath to file or folder to transfer.",
                 ValueError,
             )
 
-        processed_filepath = filepath.relative_to(base_path)
-
         top_level_folder = processed_filepath.parts[0]
         processed_filepath = Path(*processed_filepath.parts[1:])
 
-        include_list = [f"--include /{processed_filepath.as_posix()}"]
-        output = rclone.transfer_data(
+        include_list = [f"/{processed_filepath.as_posix()}"]
+        rclone.transfer_data(
             self.cfg,
             upload_or_download,
             top_level_folder,
             include_list,
             self.cfg.make_rclone_transfer_options(
-                overwrite_existing_files, dry_run
+                overwrite_existing_files, dry_run, max_age
             ),
+            utils.log,
         )
 
-        utils.log(output.stderr.decode("utf-8"))
-
     # -------------------------------------------------------------------------
     # SSH
     # -------------------------------------------------------------------------
@@ -885,14 +966,10 @@ class DataShuttle:
             full filepath (inc filename) to write the
             public key to.
         """
-        key: paramiko.RSAKey
-        key = paramiko.RSAKey.from_private_key_file(
-            self.cfg.ssh_key_path.as_posix()
-        )
+        key = ssh.load_private_key(self.cfg.ssh_key_path)
 
         with open(filepath, "w") as public:
             public.write(key.get_base64())
-        public.close()
 
     # -------------------------------------------------------------------------
     # Configs
@@ -960,6 +1037,8 @@ class DataShuttle:
                 RuntimeError,
             )
 
+        rclone.prompt_rclone_download_if_does_not_exist()
+
         cfg = Configs(
             self.project_name,
             self._config_path,
@@ -1009,8 +1088,14 @@ class DataShuttle:
         new_cfg.update(**kwargs)
         new_cfg.setup_after_load()  # will raise on error
 
+        # The derived paths are carried over by the copy and
+        # only depend on the local path, so are only rebuilt
+        # (and their folders made) if it has changed.
+        local_path_changed = new_cfg["local_path"] != self.cfg["local_path"]
+
         self.cfg = new_cfg
-        self._set_attributes_after_config_load()
+        if local_path_changed:
+            self._set_attributes_after_config_load()
         self.cfg.dump_to_file()
         self._log_successful_config_change(message=True)
         ds_logger.close_log_filehandler()
@@ -1303,6 +1388,7 @@ class DataShuttle:
         upload_or_download: Literal["upload", "download"],
         overwrite_existing_files: OverwriteExistingFiles,
         dry_run: bool,
+        max_age: Optional[str] = None,
     ) -> None:
         """
         Transfer (i.e. upload or download) the entire project (i.e.
@@ -1323,6 +1409,7 @@ class DataShuttle:
                 top_level_folder,
                 overwrite_existing_files=overwrite_existing_files,
                 dry_run=dry_run,
+                max_age=max_age,
                 init_log=False,
             )
 
@@ -1530,11 +1617,9 @@ class DataShuttle:
         """
         Raise an error if ``top_level_folder`` not correct.
         """
-        canonical_top_level_folders = canonical_folders.get_top_level_folders()
-
-        if top_level_folder not in canonical_top_level_folders:
+        if top_level_folder not in canonical_folders.TOP_LEVEL_FOLDERS_SET:
             utils.log_and_raise_error(
                 f"`top_level_folder` must be one of "
-                f"{canonical_top_level_folders}",
+                f"{list(canonical_folders.get_top_level_folders())}",
                 ValueError,
             )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import copy
 import os
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 if TYPE_CHECKING:
     from datashuttle.tui.interface import Interface
@@ -46,6 +47,9 @@ class TuiApp(App, inherit_bindings=False):  # type: ignore
         Binding("ctrl+c", "app.quit", "Exit app", priority=True),
     ]
 
+    # The global settings as last read from, or written to, disk.
+    saved_global_settings: Optional[Dict] = None
+
     def compose(self) -> ComposeResult:
         yield Container(
             Label("datashuttle", id="mainwindow_banner_label"),
@@ -175,10 +179,12 @@ class TuiApp(App, inherit_bindings=False):  # type: ignore
 
         if not settings_path.is_file():
             global_settings = self.get_default_global_settings()
+            self.saved_global_settings = None
             self.save_global_settings(global_settings)
         else:
             with open(settings_path, "r") as file:
                 global_settings = yaml.full_load(file)
+            self.saved_global_settings = copy.deepcopy(global_settings)
 
         return global_settings
 
@@ -196,6 +202,14 @@ class TuiApp(App, inherit_bindings=False):  # type: ignore
         }
 
     def save_global_settings(self, global_settings: Dict) -> None:
+        """
+        Write the global settings to disk. The write is skipped if
+        the settings are unchanged since they were last read or
+        written (e.g. the selected radio button is pressed again).
+        """
+        if global_settings == self.saved_global_settings:
+            return
+
         settings_path = self.get_global_settings_path()
 
         if not settings_path.parent.is_dir():
@@ -204,6 +218,8 @@ class TuiApp(App, inherit_bindings=False):  # type: ignore
         with open(settings_path, "w") as file:
             yaml.dump(global_settings, file, sort_keys=False)
 
+        self.saved_global_settings = copy.deepcopy(global_settings)
+
 
 def main():
     TuiApp().run()
@@ -72,71 +72,86 @@ class ConfigsContent(Container):
         `init_only_config_screen_widgets` are only displayed if we
         are instantiating a new project.
         """
+        # Widgets that are read or updated after mounting are kept
+        # as attributes, so they do not need to be queried each time.
+        self.local_path_input = ClickableInput(
+            self.parent_class.mainwindow,
+            placeholder=f"e.g. {self.get_platform_dependent_example_paths('local')}",
+            id="configs_local_path_input",
+        )
+        self.central_path_input = ClickableInput(
+            self.parent_class.mainwindow,
+            placeholder=f"e.g. {self.get_platform_dependent_example_paths('central', ssh=False)}",
+            id="configs_central_path_input",
+        )
+        self.central_path_select_button = Button(
+            "Select", id="configs_central_path_select_button"
+        )
+        self.central_host_id_input = ClickableInput(
+            self.parent_class.mainwindow,
+            placeholder="e.g. ssh.swc.ucl.ac.uk",
+            id="configs_central_host_id_input",
+        )
+        self.central_host_username_input = ClickableInput(
+            self.parent_class.mainwindow,
+            placeholder="e.g. username",
+            id="configs_central_host_username_input",
+        )
+        self.local_filesystem_radiobutton = RadioButton(
+            "Local Filesystem",
+            id="configs_local_filesystem_radiobutton",
+        )
+        self.ssh_radiobutton = RadioButton("SSH", id="configs_ssh_radiobutton")
+        self.local_only_radiobutton = RadioButton(
+            "No connection (local only)",
+            id="configs_local_only_radiobutton",
+        )
+        self.setup_ssh_connection_button = Button(
+            "Setup SSH Connection",
+            id="configs_setup_ssh_connection_button",
+        )
+        self.go_to_project_screen_button = Button(
+            "Go to Project Screen",
+            id="configs_go_to_project_screen_button",
+        )
+
         self.config_ssh_widgets = [
             Label("Central Host ID", id="configs_central_host_id_label"),
-            ClickableInput(
-                self.parent_class.mainwindow,
-                placeholder="e.g. ssh.swc.ucl.ac.uk",
-                id="configs_central_host_id_input",
-            ),
+            self.central_host_id_input,
             Label(
                 "Central Host Username",
                 id="configs_central_host_username_label",
             ),
-            ClickableInput(
-                self.parent_class.mainwindow,
-                placeholder="e.g. username",
-                id="configs_central_host_username_input",
-            ),
+            self.central_host_username_input,
         ]
 
         config_screen_widgets = [
             Label("Local Path", id="configs_local_path_label"),
             Horizontal(
-                ClickableInput(
-                    self.parent_class.mainwindow,
-                    placeholder=f"e.g. {self.get_platform_dependent_example_paths('local')}",
-                    id="configs_local_path_input",
-                ),
+                self.local_path_input,
                 Button("Select", id="configs_local_path_select_button"),
                 id="configs_local_path_button_input_container",
             ),
             Label("Connection Method", id="configs_connect_method_label"),
             RadioSet(
-                RadioButton(
-                    "Local Filesystem",
-                    id="configs_local_filesystem_radiobutton",
-                ),
-                RadioButton("SSH", id="configs_ssh_radiobutton"),
-                RadioButton(
-                    "No connection (local only)",
-                    id="configs_local_only_radiobutton",
-                ),
+                self.local_filesystem_radiobutton,
+                self.ssh_radiobutton,
+                self.local_only_radiobutton,
                 id="configs_connect_method_radioset",
             ),
             *self.config_ssh_widgets,
             Label("Central Path", id="configs_central_path_label"),
             Horizontal(
-                ClickableInput(
-                    self.parent_class.mainwindow,
-                    placeholder=f"e.g. {self.get_platform_dependent_example_paths('central', ssh=False)}",
-                    id="configs_central_path_input",
-                ),
-                Button("Select", id="configs_central_path_select_button"),
+                self.central_path_input,
+                self.central_path_select_button,
                 id="configs_central_path_button_input_container",
             ),
             Horizontal(
                 Button("Save", id="configs_save_configs_button"),
-                Button(
-                    "Setup SSH Connection",
-                    id="configs_setup_ssh_connection_button",
-                ),
+                self.setup_ssh_connection_button,
                 # Below button is always hidden when accessing
                 # configs from project manager screen
-                Button(
-                    "Go to Project Screen",
-                    id="configs_go_to_project_screen_button",
-                ),
+                self.go_to_project_screen_button,
                 id="configs_bottom_buttons_horizontal",
             ),
         ]
@@ -181,17 +196,13 @@ class ConfigsContent(Container):
         anyway as it is critical this is not on by default.
         """
         # Setup display widget defaults
-        self.query_one("#configs_go_to_project_screen_button").visible = False
+        self.go_to_project_screen_button.visible = False
         if self.interface:
             self.fill_widgets_with_project_configs()
         else:
-            self.query_one("#configs_local_filesystem_radiobutton").value = (
-                True
-            )
+            self.local_filesystem_radiobutton.value = True
             self.switch_ssh_widgets_display(display_ssh=False)
-            self.query_one("#configs_setup_ssh_connection_button").visible = (
-                False
-            )
+            self.setup_ssh_connection_button.visible = False
 
         # Setup tooltips
         if not self.interface:
@@ -199,10 +210,7 @@ class ConfigsContent(Container):
             self.query_one(id).tooltip = get_tooltip(id)
 
             # Assumes 'local_filesystem' is default if no project set.
-            assert (
-                self.query_one("#configs_local_filesystem_radiobutton").value
-                is True
-            )
+            assert self.local_filesystem_radiobutton.value is True
             self.set_central_path_input_tooltip(display_ssh=False)
         else:
             display_ssh = (
@@ -240,17 +248,13 @@ class ConfigsContent(Container):
         ], "Unexpected label."
 
         if label == "No connection (local only)":
-            self.query_one("#configs_central_path_input").value = ""
-            self.query_one("#configs_central_path_input").disabled = True
-            self.query_one("#configs_central_path_select_button").disabled = (
-                True
-            )
+            self.central_path_input.value = ""
+            self.central_path_input.disabled = True
+            self.central_path_select_button.disabled = True
             display_ssh = False
         else:
-            self.query_one("#configs_central_path_input").disabled = False
-            self.query_one("#configs_central_path_select_button").disabled = (
-                False
-            )
+            self.central_path_input.disabled = False
+            self.central_path_select_button.disabled = False
             display_ssh = True if label == "SSH" else False
 
         self.switch_ssh_widgets_display(display_ssh)
@@ -261,13 +265,12 @@ class ConfigsContent(Container):
         Use a different tooltip depending on whether connection method
         is ssh or local filesystem.
         """
-        id = "#configs_central_path_input"
         if display_ssh:
-            self.query_one(id).tooltip = get_tooltip(
+            self.central_path_input.tooltip = get_tooltip(
                 "config_central_path_input_mode-ssh"
             )
         else:
-            self.query_one(id).tooltip = get_tooltip(
+            self.central_path_input.tooltip = get_tooltip(
                 "config_central_path_input_mode-local_filesystem"
             )
 
@@ -302,30 +305,24 @@ class ConfigsContent(Container):
         display_ssh : bool
             If `True`, display the SSH-related widgets.
         """
-        for widget in self.config_ssh_widgets:
-            widget.display = display_ssh
-
-        self.query_one("#configs_central_path_select_button").display = (
-            not display_ssh
-        )
+        # Batched so the screen is refreshed once for all the changes.
+        with self.app.batch_update():
+            for widget in self.config_ssh_widgets:
+                widget.display = display_ssh
 
-        if self.interface is None:
-            self.query_one("#configs_setup_ssh_connection_button").visible = (
-                False
-            )
-        else:
-            self.query_one("#configs_setup_ssh_connection_button").visible = (
-                display_ssh
-            )
+            self.central_path_select_button.display = not display_ssh
 
-        if not self.query_one("#configs_central_path_input").value:
-            if display_ssh:
-                placeholder = f"e.g. {self.get_platform_dependent_example_paths('central', ssh=True)}"
+            if self.interface is None:
+                self.setup_ssh_connection_button.visible = False
             else:
-                placeholder = f"e.g. {self.get_platform_dependent_example_paths('central', ssh=False)}"
-            self.query_one("#configs_central_path_input").placeholder = (
-                placeholder
-            )
+                self.setup_ssh_connection_button.visible = display_ssh
+
+            if not self.central_path_input.value:
+                if display_ssh:
+                    placeholder = f"e.g. {self.get_platform_dependent_example_paths('central', ssh=True)}"
+                else:
+                    placeholder = f"e.g. {self.get_platform_dependent_example_paths('central', ssh=False)}"
+                self.central_path_input.placeholder = placeholder
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """
@@ -384,13 +381,9 @@ class ConfigsContent(Container):
             return
 
         if local_or_central == "local":
-            self.query_one("#configs_local_path_input").value = (
-                path_.as_posix()
-            )
+            self.local_path_input.value = path_.as_posix()
         elif local_or_central == "central":
-            self.query_one("#configs_central_path_input").value = (
-                path_.as_posix()
-            )
+            self.central_path_input.value = path_.as_posix()
 
     def setup_ssh_connection(self) -> None:
         """
@@ -456,20 +449,14 @@ class ConfigsContent(Container):
 
             self.interface = interface
 
-            self.query_one("#configs_go_to_project_screen_button").visible = (
-                True
-            )
+            self.go_to_project_screen_button.visible = True
 
             # Could not find a neater way to combine the push screen
             # while initiating the callback in one case but not the other.
             if cfg_kwargs["connection_method"] == "ssh":
 
-                self.query_one(
-                    "#configs_setup_ssh_connection_button"
-                ).visible = True
-                self.query_one(
-                    "#configs_setup_ssh_connection_button"
-                ).disabled = False
+                self.setup_ssh_connection_button.visible = True
+                self.setup_ssh_connection_button.disabled = False
 
                 message = (
                     "A datashuttle project has now been created.\n\n "
@@ -505,7 +492,7 @@ class ConfigsContent(Container):
 
         # Handle the edge case where connection method is changed after
         # saving on the 'Make New Project' screen.
-        self.query_one("#configs_setup_ssh_connection_button").visible = True
+        self.setup_ssh_connection_button.visible = True
 
         cfg_kwargs = self.get_datashuttle_inputs_from_widgets()
 
@@ -538,11 +525,11 @@ class ConfigsContent(Container):
         cfg_to_load = self.interface.get_textual_compatible_project_configs()
 
         # Local Path
-        input = self.query_one("#configs_local_path_input")
+        input = self.local_path_input
         input.value = cfg_to_load["local_path"]
 
         # Central Path
-        input = self.query_one("#configs_central_path_input")
+        input = self.central_path_input
         input.value = (
             cfg_to_load["central_path"] if cfg_to_load["central_path"] else ""
         )
@@ -569,7 +556,7 @@ class ConfigsContent(Container):
         )
 
         # Central Host ID
-        input = self.query_one("#configs_central_host_id_input")
+        input = self.central_host_id_input
         value = (
             ""
             if cfg_to_load["central_host_id"] is None
@@ -578,7 +565,7 @@ class ConfigsContent(Container):
         input.value = value
 
         # Central Host Username
-        input = self.query_one("#configs_central_host_username_input")
+        input = self.central_host_username_input
         value = (
             ""
             if cfg_to_load["central_host_username"] is None
@@ -593,42 +580,27 @@ class ConfigsContent(Container):
         """
         cfg_kwargs: Dict[str, Any] = {}
 
-        cfg_kwargs["local_path"] = Path(
-            self.query_one("#configs_local_path_input").value
-        )
+        cfg_kwargs["local_path"] = Path(self.local_path_input.value)
 
-        central_path_value = self.query_one(
-            "#configs_central_path_input"
-        ).value
-        if central_path_value == "":
-            cfg_kwargs["central_path"] = None
-        else:
-            cfg_kwargs["central_path"] = Path(central_path_value)
+        central_path_value = self.central_path_input.value
+        cfg_kwargs["central_path"] = (
+            Path(central_path_value) if central_path_value else None
+        )
 
-        if self.query_one("#configs_ssh_radiobutton").value:
+        if self.ssh_radiobutton.value:
             connection_method = "ssh"
-
-        elif self.query_one("#configs_local_filesystem_radiobutton").value:
+        elif self.local_filesystem_radiobutton.value:
             connection_method = "local_filesystem"
-
-        elif self.query_one("#configs_local_only_radiobutton").value:
+        else:
             connection_method = None
 
         cfg_kwargs["connection_method"] = connection_method
 
-        central_host_id = self.query_one(
-            "#configs_central_host_id_input"
-        ).value
-        cfg_kwargs["central_host_id"] = (
-            None if central_host_id == "" else central_host_id
-        )
-
-        central_host_username = self.query_one(
-            "#configs_central_host_username_input"
-        ).value
-
-        cfg_kwargs["central_host_username"] = (
-            None if central_host_username == "" else central_host_username
-        )
+        # Empty inputs are not set in the configs.
+        for key, input_ in (
+            ("central_host_id", self.central_host_id_input),
+            ("central_host_username", self.central_host_username_input),
+        ):
+            cfg_kwargs[key] = input_.value or None
 
         return cfg_kwargs
@@ -88,25 +88,30 @@ class DatatypeCheckboxes(Static):
             self.settings_key
         ]
 
+        # Map each checkbox id back to its datatype, so a change
+        # only needs to update the datatype of the changed checkbox.
+        self.checkbox_name_to_datatype = {
+            self.get_checkbox_name(datatype): datatype
+            for datatype in self.datatype_config.keys()
+        }
+
     def compose(self) -> ComposeResult:
-        for datatype in self.datatype_config.keys():
+        for datatype, is_on in self.datatype_config.items():
             yield Checkbox(
                 datatype.replace("_", " "),
                 id=self.get_checkbox_name(datatype),
-                value=self.datatype_config[datatype],
+                value=is_on,
             )
 
     @on(Checkbox.Changed)
-    def on_checkbox_changed(self) -> None:
+    def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """
         When a checkbox is changed, update the `self.datatype_config`
-        to contain new boolean values for each datatype. Also update
+        to contain the new boolean value for its datatype. Also update
         the stored `persistent_settings`.
         """
-        for datatype in self.datatype_config.keys():
-            self.datatype_config[datatype] = self.query_one(
-                f"#{self.get_checkbox_name(datatype)}"
-            ).value
+        datatype = self.checkbox_name_to_datatype[event.checkbox.id]
+        self.datatype_config[datatype] = event.value
 
         self.interface.update_tui_settings(
             self.datatype_config, self.settings_key
@@ -555,7 +560,7 @@ class TopLevelFolderSelect(Select):
         Get the top level folder that is currently selected
         on the select widget.
         """
-        assert self.value in canonical_folders.get_top_level_folders()
+        assert self.value in canonical_folders.TOP_LEVEL_FOLDERS_SET
         return self.value
 
     def on_select_changed(self, event: Select.Changed) -> None:
@@ -37,6 +37,12 @@ class Interface:
         self.name_templates: Dict = {}
         self.tui_settings: Dict = {}
 
+        # The project configs these textual-compatible configs were
+        # made from, see `get_textual_compatible_project_configs()`.
+        self.textual_compatible_configs: Optional[tuple[Configs, Configs]] = (
+            None
+        )
+
     def select_existing_project(self, project_name: str) -> InterfaceOutput:
         """
         Load an existing project into `self.project`.
@@ -394,10 +400,25 @@ class Interface:
         objects. In some cases textual requires str representation.
         This method returns datashuttle configs with all paths that
         are Path converted to str.
+
+        The project configs are replaced (not changed in place) when
+        they are updated, so the converted configs are reused until the
+        project configs object changes. The returned configs must not
+        be modified.
         """
-        cfg_to_load = copy.deepcopy(self.project.cfg)
-        load_configs.convert_str_and_pathlib_paths(cfg_to_load, "path_to_str")
-        return cfg_to_load
+        project_cfg = self.project.cfg
+
+        if (
+            self.textual_compatible_configs is None
+            or self.textual_compatible_configs[0] is not project_cfg
+        ):
+            cfg_to_load = copy.deepcopy(project_cfg)
+            load_configs.convert_str_and_pathlib_paths(
+                cfg_to_load, "path_to_str"
+            )
+            self.textual_compatible_configs = (project_cfg, cfg_to_load)
+
+        return self.textual_compatible_configs[1]
 
     def get_next_sub(
         self, top_level_folder: TopLevelFolder
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
     from datashuttle.tui.app import App
     from datashuttle.tui.interface import Interface
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
 from textual.containers import Horizontal
 from textual.widgets import (
     Button,
+    Input,
     Label,
 )
 
@@ -34,8 +36,14 @@ from datashuttle.tui.utils.tui_validators import NeuroBlueprintValidator
 class CreateFoldersTab(TreeAndInputTab):
     """
     Create new project files formatted according to the NeuroBlueprint specification.
+
+    Validation checks the names against all folders in the
+    project, so while typing it is only run once the input
+    has not changed for `validation_delay` seconds.
     """
 
+    validation_delay = 0.25
+
     def __init__(self, mainwindow: App, interface: Interface) -> None:
         super(CreateFoldersTab, self).__init__(
             "Create", id="tabscreen_create_tab"
@@ -45,28 +53,36 @@ class CreateFoldersTab(TreeAndInputTab):
 
         self.prev_click_time = 0.0
 
+        self.validation_timers: Dict[Prefix, Timer] = {}
+
     def compose(self) -> ComposeResult:
         yield CustomDirectoryTree(
             self.mainwindow,
             self.interface.get_configs()["local_path"],
             id="create_folders_directorytree",
         )
+        # The subject and session inputs are kept by prefix,
+        # so they do not need to be queried each time.
+        self.name_inputs: Dict[Prefix, ClickableInput] = {
+            "sub": ClickableInput(
+                self.mainwindow,
+                id="create_folders_subject_input",
+                placeholder="e.g. sub-001",
+                validate_on=["submitted"],
+                validators=[NeuroBlueprintValidator("sub", self)],
+            ),
+            "ses": ClickableInput(
+                self.mainwindow,
+                id="create_folders_session_input",
+                placeholder="e.g. ses-001",
+                validate_on=["submitted"],
+                validators=[NeuroBlueprintValidator("ses", self)],
+            ),
+        }
         yield Label("Subject(s)", id="create_folders_subject_label")
-        yield ClickableInput(
-            self.mainwindow,
-            id="create_folders_subject_input",
-            placeholder="e.g. sub-001",
-            validate_on=["changed", "submitted"],
-            validators=[NeuroBlueprintValidator("sub", self)],
-        )
+        yield self.name_inputs["sub"]
         yield Label("Session(s)", id="create_folders_session_label")
-        yield ClickableInput(
-            self.mainwindow,
-            id="create_folders_session_input",
-            placeholder="e.g. ses-001",
-            validate_on=["changed", "submitted"],
-            validators=[NeuroBlueprintValidator("ses", self)],
-        )
+        yield self.name_inputs["ses"]
         yield Label("Datatype(s)", id="create_folders_datatype_label")
         yield DatatypeCheckboxes(
             self.interface, id="create_folders_datatype_checkboxes"
@@ -116,6 +132,27 @@ class CreateFoldersTab(TreeAndInputTab):
                 lambda unused_bool: self.revalidate_inputs(["sub", "ses"]),
             )
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """
+        Validate the changed subject or session input once it
+        has not changed for `validation_delay` seconds. Pressing
+        enter validates the input immediately.
+        """
+        if event.input.id == "create_folders_subject_input":
+            prefix: Prefix = "sub"
+        elif event.input.id == "create_folders_session_input":
+            prefix = "ses"
+        else:
+            return
+
+        if prefix in self.validation_timers:
+            self.validation_timers[prefix].stop()
+
+        self.validation_timers[prefix] = self.set_timer(
+            self.validation_delay,
+            lambda: self.revalidate_inputs([prefix]),
+        )
+
     @require_double_click
     def on_clickable_input_clicked(
         self, event: ClickableInput.Clicked
@@ -133,9 +170,9 @@ class CreateFoldersTab(TreeAndInputTab):
         prefix: Prefix = "sub" if "subject" in input_id else "ses"
 
         if event.ctrl:
-            self.fill_input_with_template(prefix, input_id)
+            self.fill_input_with_template(prefix)
         else:
-            self.fill_input_with_next_sub_or_ses_template(prefix, input_id)
+            self.fill_input_with_next_sub_or_ses_template(prefix)
 
     def on_custom_directory_tree_directory_tree_special_key_press(
         self, event: CustomDirectoryTree.DirectoryTreeSpecialKeyPress
@@ -158,7 +195,7 @@ class CreateFoldersTab(TreeAndInputTab):
         elif event.key == "ctrl+n":
             self.mainwindow.prompt_rename_file_or_folder(event.node_path)
 
-    def fill_input_with_template(self, prefix: Prefix, input_id: str) -> None:
+    def fill_input_with_template(self, prefix: Prefix) -> None:
         """
         Given the `name_template`, fill the sub or ses
         Input with the template (based on `prefix`).
@@ -169,8 +206,7 @@ class CreateFoldersTab(TreeAndInputTab):
         else:
             fill_value = f"{prefix}-"
 
-        input = self.query_one(f"#{input_id}")
-        input.value = fill_value
+        self.name_inputs[prefix].value = fill_value
 
     def templates_on(self, prefix: Prefix) -> bool:
         return (
@@ -181,33 +217,21 @@ class CreateFoldersTab(TreeAndInputTab):
     # Validation
     # ----------------------------------------------------------------------------------
 
-    def revalidate_inputs(self, all_prefixes: List[str]) -> None:
+    def revalidate_inputs(self, all_prefixes: List[Prefix]) -> None:
         """
         Revalidate and style both subject and session
         inputs based on their value.
         """
-        input_names = {
-            "sub": "#create_folders_subject_input",
-            "ses": "#create_folders_session_input",
-        }
         for prefix in all_prefixes:
-            key = input_names[prefix]
-
-            value = self.query_one(key).value
-            self.query_one(key).validate(value=value)
+            input = self.name_inputs[prefix]
+            input.validate(value=input.value)
 
     def update_input_tooltip(self, message: List[str], prefix: Prefix) -> None:
         """
         Update the value of a subject or session tooltip, which
         indicates the validation status of the input value.
         """
-        id = (
-            "#create_folders_subject_input"
-            if prefix == "sub"
-            else "#create_folders_session_input"
-        )
-        input = self.query_one(id)
-        input.tooltip = message if any(message) else None
+        self.name_inputs[prefix].tooltip = message if any(message) else None
 
     # ----------------------------------------------------------------------------------
     # Datashuttle Callers
@@ -251,9 +275,7 @@ class CreateFoldersTab(TreeAndInputTab):
     # Filling Inputs
     # ----------------------------------------------------------------------------------
 
-    def fill_input_with_next_sub_or_ses_template(
-        self, prefix: Prefix, input_id: str
-    ) -> None:
+    def fill_input_with_next_sub_or_ses_template(self, prefix: Prefix) -> None:
         """
         This fills a sub / ses Input with a suggested name based on the
         next subject / session in the project (local).
@@ -267,9 +289,6 @@ class CreateFoldersTab(TreeAndInputTab):
 
         prefix : Prefix
             Whether to fill the subject or session Input
-
-        input_id : str
-            The textual input name to update.
         """
         top_level_folder = self.interface.tui_settings[
             "top_level_folder_select"
@@ -283,9 +302,7 @@ class CreateFoldersTab(TreeAndInputTab):
             else:
                 next_val = output
         else:
-            sub_names = self.query_one(
-                "#create_folders_subject_input"
-            ).as_names_list()
+            sub_names = self.name_inputs["sub"].as_names_list()
 
             if len(sub_names) > 1:
                 self.mainwindow.show_modal_error_dialog(
@@ -319,8 +336,7 @@ class CreateFoldersTab(TreeAndInputTab):
         else:
             fill_value = next_val
 
-        input = self.query_one(f"#{input_id}")
-        input.value = fill_value
+        self.name_inputs[prefix].value = fill_value
 
     def run_local_validation(self, prefix: Prefix):
         """
@@ -348,16 +364,12 @@ class CreateFoldersTab(TreeAndInputTab):
 
         prefix : Prefix
         """
-        sub_names = self.query_one(
-            "#create_folders_subject_input"
-        ).as_names_list()
+        sub_names = self.name_inputs["sub"].as_names_list()
 
         if prefix == "sub":
             ses_names = None
         else:
-            ses_names = self.query_one(
-                "#create_folders_session_input"
-            ).as_names_list()
+            ses_names = self.name_inputs["ses"].as_names_list()
 
         success, output = self.interface.validate_names(
             sub_names,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Set
 
 if TYPE_CHECKING:
 
@@ -73,19 +73,52 @@ class TransferStatusTree(CustomDirectoryTree):
 
     def update_local_transfer_paths(self) -> None:
         """
-        Compiles a list of all project files and paths.
+        Compiles a set of all project files and paths, which
+        is checked for every node in `format_transfer_label()`.
         """
-        paths_list = []
+        paths: Set[Path] = set()
 
         for top_level_folder in canonical_folders.get_top_level_folders():
-            walk_paths = os.walk(f"{self.local_path_str}/{top_level_folder}")
-            for path in walk_paths:
-                paths_list.append(Path(path[0]))
-                if path[2]:
-                    paths_list.extend(
-                        [Path(f"{path[0]}/{file}") for file in path[2]]
-                    )
-        self.transfer_paths = paths_list
+            self.add_folder_to_transfer_paths(
+                f"{self.local_path_str}/{top_level_folder}", paths
+            )
+        self.transfer_paths = paths
+
+    def add_folder_to_transfer_paths(
+        self, folder_path: str, paths: Set[Path]
+    ) -> None:
+        """
+        Add a folder and all files and folders within it to `paths`.
+        The type of each entry is taken from its `os.DirEntry`
+        so no extra stat is needed. As with `os.walk()`, folders
+        that cannot be read and symlinks to folders are skipped.
+        Folders are walked from a stack rather than recursively, so
+        only one folder is open at a time.
+        """
+        folders_to_walk = [folder_path]
+
+        while folders_to_walk:
+            folder_path = folders_to_walk.pop()
+
+            try:
+                with os.scandir(folder_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            paths.add(Path(folder_path))
+
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                    walk_into = is_dir and not entry.is_symlink()
+                except OSError:
+                    is_dir = walk_into = False
+
+                if walk_into:
+                    folders_to_walk.append(entry.path)
+                elif not is_dir:
+                    paths.add(Path(entry.path))
 
     def update_transfer_diffs(self) -> None:
         """
@@ -159,10 +192,10 @@ class TransferStatusTree(CustomDirectoryTree):
             # fmt: off
             if node_relative_path in self.transfer_diffs["same"]:
                 pass
-            elif node_relative_path in self.transfer_diffs["different"] or any([node_relative_path in file for file in self.transfer_diffs["different"]]):
+            elif node_relative_path in self.transfer_diffs["different"] or any(node_relative_path in file for file in self.transfer_diffs["different"]):
                 node_label.stylize_before("gold3")
-            elif node_relative_path in self.transfer_diffs["local_only"] or any([node_relative_path in file for file in self.transfer_diffs["local_only"]]):
+            elif node_relative_path in self.transfer_diffs["local_only"] or any(node_relative_path in file for file in self.transfer_diffs["local_only"]):
                 node_label.stylize_before("green3")
-            elif node_label.plain in self.transfer_diffs["error"] or any([node_relative_path in file for file in self.transfer_diffs["error"]]):
+            elif node_label.plain in self.transfer_diffs["error"] or any(node_relative_path in file for file in self.transfer_diffs["error"]):
                 node_label.stylize_before("bright_red")
             # fmt: on
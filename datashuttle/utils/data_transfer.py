@@ -1,15 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import List, Literal, Optional, Tuple, Union
 
-from datashuttle.configs import canonical_folders
+from datashuttle.configs import canonical_folders, canonical_tags
 from datashuttle.configs.config_class import Configs
-from datashuttle.utils import folders, formatting, rclone, utils
+from datashuttle.utils import folders, formatting, rclone, ssh, utils
 from datashuttle.utils.custom_types import (
     OverwriteExistingFiles,
     Prefix,
     TopLevelFolder,
 )
 
+# Subjects are searched concurrently as searching is I/O bound (in
+# particular over SSH). Kept below the default SSH server MaxSessions (10),
+# as each concurrent search uses its own SFTP channel.
+MAX_SEARCH_WORKERS = 8
+
 
 class TransferData:
     """
@@ -55,6 +62,10 @@ class TransferData:
         If `True`, transfer will not actually occur but will be logged
         as if it did (to see what would happen for a transfer).
 
+    max_age : Optional[str]
+        If set, only files modified within this age (e.g. "2d")
+        are transferred, see rclone's `--max-age`.
+
     log : bool,
         if `True`, log and print the transfer output.
     """
@@ -69,6 +80,7 @@ class TransferData:
         datatype: Union[str, List[str]],
         overwrite_existing_files: OverwriteExistingFiles,
         dry_run: bool,
+        max_age: Optional[str],
         log: bool,
     ):
         self.__cfg = cfg
@@ -87,21 +99,44 @@ class TransferData:
 
         self.check_input_arguments()
 
-        include_list = self.build_a_list_of_all_files_and_folders_to_transfer()
+        # Made first, so invalid options raise before searching.
+        rclone_options = cfg.make_rclone_transfer_options(
+            overwrite_existing_files, dry_run, max_age
+        )
+
+        # Folder searches are cached while the transfer list is built,
+        # and the cache is discarded once it is, see `search_for_folders()`.
+        self.__search_cache: folders.SearchCache = {}
+
+        # Searches of central over SSH share one connection,
+        # which is closed once the transfer list is built.
+        self.__sftp_pool = ssh.SFTPClientPool(self.__cfg)
+
+        try:
+            if (
+                self.__local_or_central == "central"
+                and self.__cfg["connection_method"] == "ssh"
+                and self.sub_or_ses_names_are_searched()
+            ):
+                self.prefetch_central_folder_tree()
+
+            include_list = (
+                self.build_a_list_of_all_files_and_folders_to_transfer()
+            )
+        finally:
+            self.__sftp_pool.close()
+
+        self.__search_cache.clear()
 
         if any(include_list):
-            output = rclone.transfer_data(
+            rclone.transfer_data(
                 self.__cfg,
                 self.__upload_or_download,
                 self.__top_level_folder,
                 include_list,
-                cfg.make_rclone_transfer_options(
-                    overwrite_existing_files, dry_run
-                ),
+                rclone_options,
+                utils.log_and_message if log else lambda line: None,
             )
-
-            if log:
-                utils.log_and_message(output.stderr.decode("utf-8"))
         else:
             if log:
                 utils.log_and_message("No files included. None transferred.")
@@ -124,85 +159,183 @@ class TransferData:
         -------
 
         include_list : List[str]
-            A list of paths to pass to rclone's `--include` flag.
+            A list of rclone `--include` filter patterns.
         """
         # Find sub names to transfer
-        processed_sub_names = self.get_processed_names(self.sub_names)
+        processed_sub_names = self.get_processed_names(
+            self.format_names(self.sub_names, "sub")
+        )
+        self.log_processed_names(processed_sub_names, "sub")
+
+        # The session names are the same for every subject,
+        # so are only formatted once.
+        formatted_ses_names = self.format_names(self.ses_names, "ses")
+
+        with ThreadPoolExecutor(
+            max_workers=max(
+                1, min(MAX_SEARCH_WORKERS, len(processed_sub_names))
+            )
+        ) as executor:
+            sub_include_lists = list(
+                executor.map(
+                    self.get_sub_include_lists,
+                    processed_sub_names,
+                    repeat(formatted_ses_names),
+                )
+            )
 
         sub_ses_dtype_include: List[str] = []
         extra_folder_names: List[str] = []
         extra_filenames: List[str] = []
 
-        for sub in processed_sub_names:
-            # subjects at top level folder ------------------------------------
+        # Logged here rather than in the (concurrent) searches,
+        # so that the session names are logged in subject order.
+        for sub, (
+            processed_ses_names,
+            sub_dtype,
+            sub_folders,
+            sub_files,
+        ) in zip(processed_sub_names, sub_include_lists):
+            if sub != "all_non_sub":
+                self.log_processed_names(processed_ses_names, "ses")
+
+            sub_ses_dtype_include += sub_dtype
+            extra_folder_names += sub_folders
+            extra_filenames += sub_files
 
-            if sub == "all_non_sub":
-                self.update_list_with_non_sub_top_level_folders(
-                    extra_folder_names, extra_filenames
-                )
-                continue
+        include_list = (
+            self.make_include_arg(sub_ses_dtype_include)
+            + self.make_include_arg(extra_folder_names)
+            + self.make_include_arg(extra_filenames, recursive=False)
+        )
 
-            self.update_list_with_dtype_paths(
+        return include_list
+
+    def sub_or_ses_names_are_searched(self) -> bool:
+        """
+        Return `True` if the subject or session names (e.g. "all_sub",
+        or names including the wildcard tag) must be searched for in
+        the top-level folder. Otherwise, only the named subject and
+        session folders are searched.
+        """
+        for names, prefix in (
+            (self.sub_names, "sub"),
+            (self.ses_names, "ses"),
+        ):
+            if any(
+                name in ("all", f"all_{prefix}")
+                or canonical_tags.tags("*") in name
+                for name in names
+            ):
+                return True
+
+        return False
+
+    def prefetch_central_folder_tree(self) -> None:
+        """
+        List the subject, session and datatype levels of the central
+        top-level folder with one rclone call, and add them to the
+        search cache. Otherwise, over SSH, each subject and session
+        folder is listed with a separate round trip. This is only
+        worthwhile when the subject or session names are searched
+        (see `sub_or_ses_names_are_searched()`).
+        """
+        max_depth = 3
+
+        listing = rclone.get_central_folder_tree_listing(
+            self.__cfg, self.__base_folder, max_depth
+        )
+
+        if listing is not None:
+            folders.add_folder_tree_listing_to_search_cache(
+                self.__search_cache,
+                listing,
+                self.__base_folder,
+                "central",
+                max_depth,
+            )
+
+    def get_sub_include_lists(
+        self, sub: str, formatted_ses_names: List[str]
+    ) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """
+        Build the lists of paths to transfer for a single subject
+        (see `build_a_list_of_all_files_and_folders_to_transfer()`).
+        This is run concurrently for all subjects. The processed
+        session names are returned first, to be logged by the caller.
+
+        `formatted_ses_names` are the session names
+        passed through `format_names()`.
+        """
+        sub_ses_dtype_include: List[str] = []
+        extra_folder_names: List[str] = []
+        extra_filenames: List[str] = []
+
+        # subjects at top level folder ----------------------------------------
+
+        if sub == "all_non_sub":
+            self.update_list_with_non_sub_top_level_folders(
+                extra_folder_names, extra_filenames
+            )
+            return (
+                [],
                 sub_ses_dtype_include,
-                self.datatype,
-                sub,
+                extra_folder_names,
+                extra_filenames,
             )
 
-            # sessions at sub level folder ------------------------------------
+        self.update_list_with_dtype_paths(
+            sub_ses_dtype_include,
+            self.datatype,
+            sub,
+        )
 
-            processed_ses_names = self.get_processed_names(self.ses_names, sub)
+        # sessions at sub level folder ----------------------------------------
 
-            for ses in processed_ses_names:
-                if ses == "all_non_ses":
-                    self.update_list_with_non_ses_sub_level_folders(
-                        extra_folder_names, extra_filenames, sub
-                    )
+        processed_ses_names = self.get_processed_names(
+            formatted_ses_names, sub
+        )
 
-                    continue
+        for ses in processed_ses_names:
+            if ses == "all_non_ses":
+                self.update_list_with_non_ses_sub_level_folders(
+                    extra_folder_names, extra_filenames, sub
+                )
 
-                # Datatype (sub and ses level) --------------------------------
+                continue
 
-                if self.transfer_non_datatype(self.datatype):
-                    self.update_list_with_non_dtype_ses_level_folders(
-                        extra_folder_names, extra_filenames, sub, ses
-                    )
+            # Datatype (sub and ses level) ------------------------------------
 
-                self.update_list_with_dtype_paths(
-                    sub_ses_dtype_include,
-                    self.datatype,
-                    sub,
-                    ses,
+            if self.transfer_non_datatype(self.datatype):
+                self.update_list_with_non_dtype_ses_level_folders(
+                    extra_folder_names, extra_filenames, sub, ses
                 )
 
-        include_list = (
-            self.make_include_arg(sub_ses_dtype_include)
-            + self.make_include_arg(extra_folder_names)
-            + self.make_include_arg(extra_filenames, recursive=False)
-        )
+            self.update_list_with_dtype_paths(
+                sub_ses_dtype_include,
+                self.datatype,
+                sub,
+                ses,
+            )
 
-        return include_list
+        return (
+            processed_ses_names,
+            sub_ses_dtype_include,
+            extra_folder_names,
+            extra_filenames,
+        )
 
     def make_include_arg(
         self, list_of_paths: List[str], recursive: bool = True
     ) -> List[str]:
         """
-        Format the list of paths to rclone's required
-        `--include` flag format.
+        Format the list of paths to rclone `--include`
+        filter patterns (see `rclone.transfer_data()`).
         """
-        if not any(list_of_paths):
-            return []
-
         if recursive:
+            return [f"{ele}/**" for ele in list_of_paths]
 
-            def include_arg(ele: str) -> str:
-                return f' --include "{ele}/**" '
-
-        else:
-
-            def include_arg(ele: str) -> str:
-                return f' --include "{ele}" '
-
-        return ["".join([include_arg(ele) for ele in list_of_paths])]
+        return list(list_of_paths)
 
     # -------------------------------------------------------------------------
     # Search for non-sub / ses / dtype folders and add them to list
@@ -218,11 +351,11 @@ class TransferData:
         """
         top_level_folders, top_level_files = folders.search_sub_or_ses_level(
             self.__cfg,
-            self.__cfg.get_base_folder(
-                self.__local_or_central, self.__top_level_folder
-            ),
+            self.__base_folder,
             self.__local_or_central,
             search_str="*",
+            search_cache=self.__search_cache,
+            sftp_pool=self.__sftp_pool,
         )
 
         top_level_folders = list(
@@ -244,17 +377,18 @@ class TransferData:
         """
         sub_level_folders, sub_level_files = folders.search_sub_or_ses_level(
             self.__cfg,
-            self.__cfg.get_base_folder(
-                self.__local_or_central, self.__top_level_folder
-            ),
+            self.__base_folder,
             self.__local_or_central,
             sub=sub,
             search_str="*",
+            search_cache=self.__search_cache,
+            sftp_pool=self.__sftp_pool,
         )
         sub_level_dtype = [
             dtype.name
-            for dtype in canonical_folders.get_datatype_folders().values()
-            if dtype.level == "sub"
+            for dtype in canonical_folders.get_datatype_folders_by_level()[
+                "sub"
+            ]
         ]
 
         filt_sub_level_folders = filter(
@@ -283,19 +417,20 @@ class TransferData:
             ses_level_filenames,
         ) = folders.search_sub_or_ses_level(
             self.__cfg,
-            self.__cfg.get_base_folder(
-                self.__local_or_central, self.__top_level_folder
-            ),
+            self.__base_folder,
             self.__local_or_central,
             sub=sub,
             ses=ses,
             search_str="*",
+            search_cache=self.__search_cache,
+            sftp_pool=self.__sftp_pool,
         )
 
         ses_level_dtype = [
             dtype.name
-            for dtype in canonical_folders.get_datatype_folders().values()
-            if dtype.level == "ses"
+            for dtype in canonical_folders.get_datatype_folders_by_level()[
+                "ses"
+            ]
         ]
         filt_ses_level_folders = filter(
             lambda folder: folder not in ses_level_dtype, ses_level_folders
@@ -331,11 +466,13 @@ class TransferData:
             datatype,
             sub,
             ses,
+            search_cache=self.__search_cache,
+            sftp_pool=self.__sftp_pool,
         )
 
         level = "ses" if ses else "sub"
 
-        for datatype_key, datatype_folder in datatype_items:  # type: ignore
+        for datatype_key, datatype_folder in datatype_items:
             if datatype_folder.level == level:
                 if ses:
                     filepath = Path(sub) / ses / datatype_folder.name
@@ -373,7 +510,7 @@ class TransferData:
         see update_list_with_dtype_paths()
         """
         if len(self.sub_names) > 1 and any(
-            [name in ["all", "all_sub"] for name in self.sub_names]
+            name in ["all", "all_sub"] for name in self.sub_names
         ):
             utils.log_and_raise_error(
                 "'sub_names' must only include 'all' "
@@ -382,7 +519,7 @@ class TransferData:
             )
 
         if len(self.ses_names) > 1 and any(
-            [name in ["all", "all_ses"] for name in self.ses_names]
+            name in ["all", "all_ses"] for name in self.ses_names
         ):
             utils.log_and_raise_error(
                 "'ses_names' must only include 'all' "
@@ -391,7 +528,7 @@ class TransferData:
             )
 
         if len(self.datatype) > 1 and any(
-            [name in ["all", "all_datatype"] for name in self.datatype]
+            name in folders.ALL_DATATYPE_KEYWORDS for name in self.datatype
         ):
             utils.log_and_raise_error(
                 "'datatype' must only include 'all' "
@@ -413,17 +550,28 @@ class TransferData:
     # Format Arguments
     # -------------------------------------------------------------------------
 
+    def format_names(self, names: List[str], prefix: Prefix) -> List[str]:
+        """
+        Check and format the list of subject or session names as per
+        formatting.check_and_format_names(). "all" or "all_<prefix>"
+        are left as they are, to be searched for in
+        `get_processed_names()`.
+        """
+        if len(names) == 1 and names[0] in ("all", f"all_{prefix}"):
+            return names
+
+        return formatting.check_and_format_names(names, prefix)
+
     def get_processed_names(
         self,
         names_checked: List[str],
         sub: Optional[str] = None,
     ) -> List[str]:
         """
-        Process the list of subject session names.
+        Process the list of subject session names, which must
+        already be formatted with `format_names()`.
         If they are pre-defined (e.g. ["sub-001", "sub-002"])
-        they will be checked and formatted as per
-        formatting.check_and_format_names() and
-        any wildcard entries searched.
+        any wildcard entries are searched.
 
         Otherwise, if "all" or a variant, the local or
         central folder (depending on upload vs. download)
@@ -449,34 +597,42 @@ class TransferData:
                 self.__local_or_central,
                 sub,
                 search_str=f"{prefix}-*",
+                search_cache=self.__search_cache,
+                sftp_pool=self.__sftp_pool,
             )[0]
 
             if names_checked == ["all"]:
                 processed_names += [f"all_non_{prefix}"]
 
         else:
-            processed_names = formatting.check_and_format_names(
-                names_checked, prefix
-            )
             processed_names = folders.search_for_wildcards(
                 self.__cfg,
                 self.__base_folder,
                 self.__local_or_central,
-                processed_names,
+                names_checked,
                 sub=sub,
+                search_cache=self.__search_cache,
+                sftp_pool=self.__sftp_pool,
             )
 
+        return processed_names
+
+    def log_processed_names(
+        self, processed_names: List[str], prefix: Prefix
+    ) -> None:
+        """
+        Log the names found by `get_processed_names()`. This is
+        kept separate as names are searched for concurrently.
+        """
         utils.log_and_message(
             f"The {prefix} names to transfer are: {processed_names}"
         )
 
-        return processed_names
-
     def transfer_non_datatype(self, datatype_checked: List[str]) -> bool:
         """
         Convenience function, bool if all non-datatype folders
         are to be transferred
         """
         return any(
-            [name in ["all_non_datatype", "all"] for name in datatype_checked]
+            name in ["all_non_datatype", "all"] for name in datatype_checked
         )
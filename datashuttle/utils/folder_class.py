@@ -1,15 +1,16 @@
-class Folder:
+from typing import NamedTuple
+
+
+class Folder(NamedTuple):
     """
     Folder class used to contain details of canonical
     folders in the project folder tree.
 
+    This is immutable, use `_replace()` to
+    make a copy with changed fields.
+
     see configs.canonical_folders.py for details.
     """
 
-    def __init__(
-        self,
-        name: str,
-        level: str,
-    ):
-        self.name = name
-        self.level = level
+    name: str
+    level: str
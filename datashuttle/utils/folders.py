@@ -4,6 +4,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -11,12 +12,13 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import ItemsView
+    from collections.abc import Iterable, Mapping
 
     from datashuttle.configs.config_class import Configs
     from datashuttle.utils.custom_types import TopLevelFolder
+    from datashuttle.utils.folder_class import Folder
 
-import glob
+import fnmatch
 import os
 from pathlib import Path
 
@@ -24,6 +26,15 @@ from datashuttle.configs import canonical_folders, canonical_tags
 from datashuttle.utils import ssh, utils, validation
 from datashuttle.utils.custom_exceptions import NeuroBlueprintError
 
+# Keywords that select every datatype folder found on the filesystem.
+ALL_DATATYPE_KEYWORDS = frozenset(("all", "all_datatype"))
+
+# Full (folder names, file names) listings of searched folders, keyed
+# by (local_or_central, path), see `search_for_folders()`. A cache
+# is made for a single operation (e.g. building a transfer list)
+# so searches are never served stale listings.
+SearchCache = Dict[Tuple[str, str], Tuple[List[Any], List[Any]]]
+
 # -----------------------------------------------------------------------------
 # Create Folders
 # -----------------------------------------------------------------------------
@@ -71,6 +82,8 @@ def create_folder_trees(
             "ses": [],
         }
 
+    # Only the deepest folders are made, as making
+    # them also makes the subject and session folders.
     for sub in sub_names:
         sub_path = cfg.build_project_path(
             "local",
@@ -78,20 +91,15 @@ def create_folder_trees(
             top_level_folder,
         )
 
-        create_folders(sub_path, log)
-
         if not any(ses_names):
+            create_folders(sub_path, log)
             all_paths["sub"].append(sub_path)
             continue
 
+        # Session paths are joined directly onto the subject path
+        # rather than rebuilt from the base folder for each session.
         for ses in ses_names:
-            ses_path = cfg.build_project_path(
-                "local",
-                [sub, ses],
-                top_level_folder,
-            )
-
-            create_folders(ses_path, log)
+            ses_path = sub_path / ses
 
             if datatype_passed:
                 make_datatype_folders(
@@ -103,6 +111,7 @@ def create_folder_trees(
                     log=log,
                 )
             else:
+                create_folders(ses_path, log)
                 all_paths["ses"].append(ses_path)
 
     return all_paths
@@ -120,6 +129,8 @@ def make_datatype_folders(
     Make datatype folder (e.g. behav) at the sub or ses
     level. Checks folder_class.Folders attributes,
     whether the datatype is used and at the current level.
+    If no datatype folder is made at this level, the sub or
+    ses folder itself is made.
 
     Parameters
     ----------
@@ -143,7 +154,9 @@ def make_datatype_folders(
     """
     datatype_items = cfg.get_datatype_as_dict_items(datatype)
 
-    for datatype_key, datatype_folder in datatype_items:  # type: ignore
+    made_datatype_folder = False
+
+    for datatype_key, datatype_folder in datatype_items:
         if datatype_folder.level == level:
 
             datatype_name = datatype_folder.name
@@ -151,6 +164,7 @@ def make_datatype_folders(
             datatype_path = sub_or_ses_level_path / datatype_name
 
             create_folders(datatype_path, log)
+            made_datatype_folder = True
 
             # Use the custom datatype names for the output.
             if datatype_name in save_paths:
@@ -158,31 +172,45 @@ def make_datatype_folders(
             else:
                 save_paths[datatype_name] = [datatype_path]
 
+    if not made_datatype_folder:
+        create_folders(sub_or_ses_level_path, log)
+
 
 # Create Folders Helpers --------------------------------------------------------
 
 
 def create_folders(paths: Union[Path, List[Path]], log: bool = True) -> None:
     """
-    For path or list of paths, make them if
-    they do not already exist.
+    For path or list of paths, make them (and any missing
+    parent folders) if they do not already exist.
 
     Parameters
     ----------
 
     paths : Path or list of Paths to create
 
-    log : if True, log all made folders. This
+    log : if True, log all made folders, including parents. This
         requires the logger to already be initialised.
     """
     if isinstance(paths, Path):
         paths = [paths]
 
     for path_ in paths:
-        if not path_.is_dir():
-            path_.mkdir(parents=True)
-            if log:
-                utils.log(f"Made folder at path: {path_}")
+        if os.path.isdir(path_):
+            continue
+
+        if log:
+            new_folders = [path_]
+            for parent in path_.parents:
+                if os.path.isdir(parent):
+                    break
+                new_folders.append(parent)
+
+        os.makedirs(path_, exist_ok=True)
+
+        if log:
+            for new_folder in reversed(new_folders):
+                utils.log(f"Made folder at path: {new_folder}")
 
 
 # -----------------------------------------------------------------------------
@@ -199,6 +227,7 @@ def search_project_for_sub_or_ses_names(
     sub: Optional[str],
     search_str: str,
     local_only: bool,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
 ) -> Dict:
     """
     If sub is None, the top-level level folder will be
@@ -210,6 +239,9 @@ def search_project_for_sub_or_ses_names(
     as session folders for local subjects that are not yet on central
     will be searched for on central, showing a confusing 'folder not found'
     message.
+
+    `sftp_pool` is used for searches of central over SSH,
+    see `ssh.search_ssh_central_for_folders()`.
     """
 
     # Search local and central for folders that begin with "sub-*"
@@ -234,6 +266,7 @@ def search_project_for_sub_or_ses_names(
             sub,
             search_str=search_str,
             verbose=False,
+            sftp_pool=sftp_pool,
         )
     return {"local": local_foldernames, "central": central_foldernames}
 
@@ -249,7 +282,9 @@ def items_from_datatype_input(
     datatype: Union[list, str],
     sub: str,
     ses: Optional[str] = None,
-) -> Union[ItemsView, zip]:
+    search_cache: Optional[SearchCache] = None,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
+) -> Iterable[Tuple[str, Folder]]:
     """
     Get the list of datatypes to transfer, either
     directly from user input, or by searching
@@ -262,12 +297,11 @@ def items_from_datatype_input(
     """
     base_folder = cfg.get_base_folder(local_or_central, top_level_folder)
 
-    if datatype not in [
-        "all",
-        ["all"],
-        "all_datatype",
-        ["all_datatype"],
-    ]:
+    datatype_list = [datatype] if isinstance(datatype, str) else datatype
+
+    if not (
+        len(datatype_list) == 1 and datatype_list[0] in ALL_DATATYPE_KEYWORDS
+    ):
         datatype_items = cfg.get_datatype_as_dict_items(
             datatype,
         )
@@ -278,6 +312,8 @@ def items_from_datatype_input(
             local_or_central,
             sub,
             ses,
+            search_cache=search_cache,
+            sftp_pool=sftp_pool,
         )
 
     return datatype_items
@@ -289,7 +325,9 @@ def search_for_datatype_folders(
     local_or_central: str,
     sub: str,
     ses: Optional[str] = None,
-) -> zip:
+    search_cache: Optional[SearchCache] = None,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
+) -> Iterator[Tuple[str, Folder]]:
     """
     Search a subject or session folder specifically
     for datatypes. First searches for all folders / files
@@ -305,7 +343,13 @@ def search_for_datatype_folders(
     a format that mirrors dict.items()
     """
     search_results = search_sub_or_ses_level(
-        cfg, base_folder, local_or_central, sub, ses
+        cfg,
+        base_folder,
+        local_or_central,
+        sub,
+        ses,
+        search_cache=search_cache,
+        sftp_pool=sftp_pool,
     )[0]
 
     data_folders = process_glob_to_find_datatype_folders(
@@ -317,8 +361,8 @@ def search_for_datatype_folders(
 
 def process_glob_to_find_datatype_folders(
     folder_names: list,
-    datatype_folders: dict,
-) -> zip:
+    datatype_folders: Mapping,
+) -> Iterator[Tuple[str, Folder]]:
     """
     Process the results of glob on a sub or session level,
     which could contain any kind of folder / file.
@@ -330,20 +374,17 @@ def process_glob_to_find_datatype_folders(
     Find the datatype files and return in
     a format that mirrors dict.items()
     """
-    ses_folder_keys = []
-    ses_folder_values = []
-    for name in folder_names:
-        datatype_key = [
-            key
-            for key, value in datatype_folders.items()
-            if value.name == name
-        ]
-
-        if datatype_key:
-            ses_folder_keys.append(datatype_key[0])
-            ses_folder_values.append(datatype_folders[datatype_key[0]])
-
-    return zip(ses_folder_keys, ses_folder_values)
+    # Map each folder name to its datatype key (the first
+    # key if a name is shared) so each name is found in O(1).
+    name_to_key: Dict[str, str] = {}
+    for key, value in datatype_folders.items():
+        name_to_key.setdefault(value.name, key)
+
+    return (
+        (name_to_key[name], datatype_folders[name_to_key[name]])
+        for name in folder_names
+        if name in name_to_key
+    )
 
 
 # Wildcards
@@ -356,6 +397,8 @@ def search_for_wildcards(
     local_or_central: str,
     all_names: List[str],
     sub: Optional[str] = None,
+    search_cache: Optional[SearchCache] = None,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
 ) -> List[str]:
     """
     Handle wildcard flag in upload or download.
@@ -389,6 +432,11 @@ def search_for_wildcards(
     sub : optional subject to search for sessions in. If not provided,
         will search for subjects rather than sessions.
 
+    search_cache : optional cache of searched folders,
+        see `search_for_folders()`.
+
+    sftp_pool : optional connection used for searches of central
+        over SSH, see `ssh.search_ssh_central_for_folders()`.
     """
     new_all_names = []
     for name in all_names:
@@ -397,11 +445,22 @@ def search_for_wildcards(
 
             if sub:
                 matching_names = search_sub_or_ses_level(
-                    cfg, base_folder, local_or_central, sub, search_str=name
+                    cfg,
+                    base_folder,
+                    local_or_central,
+                    sub,
+                    search_str=name,
+                    search_cache=search_cache,
+                    sftp_pool=sftp_pool,
                 )[0]
             else:
                 matching_names = search_sub_or_ses_level(
-                    cfg, base_folder, local_or_central, search_str=name
+                    cfg,
+                    base_folder,
+                    local_or_central,
+                    search_str=name,
+                    search_cache=search_cache,
+                    sftp_pool=sftp_pool,
                 )[0]
 
             new_all_names += matching_names
@@ -428,6 +487,8 @@ def search_sub_or_ses_level(
     ses: Optional[str] = None,
     search_str: str = "*",
     verbose: bool = True,
+    search_cache: Optional[SearchCache] = None,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
 ) -> Tuple[List[str], List[str]]:
     """
     Search project folder at the subject or session level.
@@ -456,6 +517,12 @@ def search_sub_or_ses_level(
 
     verbose : If `True`, if a search folder cannot be found, a message
               will be printed with the un-found path.
+
+    search_cache : optional cache of searched folders,
+        see `search_for_folders()`.
+
+    sftp_pool : optional connection used for searches of central
+        over SSH, see `ssh.search_ssh_central_for_folders()`.
     """
     if ses and not sub:
         utils.log_and_raise_error(
@@ -476,17 +543,72 @@ def search_sub_or_ses_level(
         local_or_central,
         search_str,
         verbose,
+        search_cache,
+        sftp_pool,
     )
 
     return all_folder_names, all_filenames
 
 
+def add_folder_tree_listing_to_search_cache(
+    search_cache: SearchCache,
+    listing: str,
+    base_folder: Path,
+    local_or_central: str,
+    max_depth: int,
+) -> None:
+    """
+    Add a recursive listing of `base_folder` (see
+    `rclone.get_central_folder_tree_listing()`) to `search_cache`,
+    so that searches of any folder it fully lists are served from
+    a single listing.
+
+    Parameters
+    ----------
+
+    search_cache : the cache to add to, see `search_for_folders()`.
+
+    listing : newline-separated paths relative to `base_folder`,
+        with folders ending in "/".
+
+    max_depth : the depth `listing` was made to. Folders at this depth
+        are not fully listed, and so are not cached.
+    """
+    listings: Dict[str, Tuple[List[str], List[str]]] = {
+        base_folder.as_posix(): ([], [])
+    }
+
+    for line in listing.splitlines():
+        if not line:
+            continue
+
+        is_folder = line.endswith("/")
+        parts = line.rstrip("/").split("/")
+
+        parent = base_folder.joinpath(*parts[:-1]).as_posix()
+        folder_names, filenames = listings.setdefault(parent, ([], []))
+
+        if is_folder:
+            folder_names.append(parts[-1])
+            if len(parts) < max_depth:
+                listings.setdefault(
+                    base_folder.joinpath(*parts).as_posix(), ([], [])
+                )
+        else:
+            filenames.append(parts[-1])
+
+    for path_, folder_listing in listings.items():
+        search_cache[(local_or_central, path_)] = folder_listing
+
+
 def search_for_folders(
     cfg: Configs,
     search_path: Path,
     local_or_central: str,
     search_prefix: str,
     verbose: bool = True,
+    search_cache: Optional[SearchCache] = None,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
 ) -> Tuple[List[Any], List[Any]]:
     """
     Wrapper to determine the method used to search for search
@@ -500,6 +622,43 @@ def search_for_folders(
     search_prefix : file / folder name to search (e.g. "sub-*")
     verbose : If `True`, when a search folder cannot be found, a message
           will be printed with the missing path.
+    search_cache : if given, the full contents of the searched folder are
+          stored in (or read from) this cache, so searching the same
+          folder again (e.g. for a different prefix) does not hit
+          the filesystem or central server.
+    sftp_pool : connection used for searches of central over SSH,
+          see `ssh.search_ssh_central_for_folders()`.
+    """
+    if search_cache is not None:
+        key = (local_or_central, search_path.as_posix())
+
+        if key not in search_cache:
+            search_cache[key] = search_for_folders_uncached(
+                cfg, search_path, local_or_central, "*", verbose, sftp_pool
+            )
+
+        all_folder_names, all_filenames = search_cache[key]
+        return (
+            fnmatch.filter(all_folder_names, search_prefix),
+            fnmatch.filter(all_filenames, search_prefix),
+        )
+
+    return search_for_folders_uncached(
+        cfg, search_path, local_or_central, search_prefix, verbose, sftp_pool
+    )
+
+
+def search_for_folders_uncached(
+    cfg: Configs,
+    search_path: Path,
+    local_or_central: str,
+    search_prefix: str,
+    verbose: bool = True,
+    sftp_pool: Optional[ssh.SFTPClientPool] = None,
+) -> Tuple[List[Any], List[Any]]:
+    """
+    Search for folders as in `search_for_folders()`,
+    never using cached results.
     """
     if local_or_central == "central" and cfg["connection_method"] == "ssh":
         all_folder_names, all_filenames = ssh.search_ssh_central_for_folders(
@@ -507,6 +666,7 @@ def search_for_folders(
             search_prefix,
             cfg,
             verbose,
+            sftp_pool,
         )
     else:
         if not search_path.exists():
@@ -526,15 +686,44 @@ def search_filesystem_path_for_folders(
     search_path_with_prefix: Path,
 ) -> Tuple[List[str], List[str]]:
     """
-    Use glob to search the full search path (including prefix) with glob.
+    Search the full search path (including prefix), where the prefix
+    is a glob-style pattern matched against the names in its parent folder.
     Files are filtered out of results, returning folders only.
+
+    The folder is listed with `os.scandir()`, which in most cases reads
+    the entry type from the directory listing itself rather than
+    calling stat on each match. As with `glob`, hidden entries are
+    only matched if the pattern starts with ".".
     """
+    parent_path = search_path_with_prefix.parent
+    pattern = search_path_with_prefix.name
+    match_hidden = pattern.startswith(".")
+    name_matches = utils.get_name_matcher(pattern)
+
     all_folder_names = []
     all_filenames = []
-    for file_or_folder in glob.glob(search_path_with_prefix.as_posix()):
-        if os.path.isdir(file_or_folder):
-            all_folder_names.append(os.path.basename(file_or_folder))
-        else:
-            all_filenames.append(os.path.basename(file_or_folder))
+    try:
+        with os.scandir(parent_path) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") and not match_hidden:
+                    continue
+                if not name_matches(entry.name):
+                    continue
+
+                # As with `os.path.isdir()`, entries that
+                # cannot be checked are treated as files.
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    all_folder_names.append(entry.name)
+                else:
+                    all_filenames.append(entry.name)
+    except OSError:
+        # As with `glob`, folders that cannot be
+        # listed (e.g. missing or unreadable) have no matches.
+        pass
 
     return all_folder_names, all_filenames
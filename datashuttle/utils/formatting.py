@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from datashuttle.utils.custom_types import Prefix
 
-from datashuttle.configs.canonical_folders import canonical_reserved_keywords
+from datashuttle.configs.canonical_folders import RESERVED_KEYWORDS_SET
 from datashuttle.configs.canonical_tags import tags
 from datashuttle.utils import utils, validation
 
+# Tags replaced with the current date / time on formatting.
+DATETIME_TAGS = (tags("date"), tags("time"), tags("datetime"))
+
 # -----------------------------------------------------------------------------
 # Format Sub / Ses Names
 # -----------------------------------------------------------------------------
@@ -34,7 +38,7 @@ def check_and_format_names(
     However, in practice this is not an issue because you won't make a
     folder with "@*@" in it anyway, this is strictly for searching
     during upload / download.
-    see canonical_folders.canonical_reserved_keywords() for more information.
+    see canonical_folders.RESERVED_KEYWORDS_SET for more information.
 
     Parameters
     ----------
@@ -53,13 +57,74 @@ def check_and_format_names(
     bypass_validation : Dict
         If `True`, NeuroBlueprint validation will be performed
         on the passed names.
+
+    Notes
+    -----
+    The same names are often checked repeatedly (e.g. in the TUI),
+    so results are cached (see `check_and_format_names_cached()`).
+    Only lists of names are cached, other inputs are left to the
+    type checks. Names with date or time tags are not cached, as they
+    are formatted with the current date and time.
     """
     if isinstance(names, str):
         names = [names]
 
+    if isinstance(names, list) and all(
+        isinstance(name, str) and not any(tag in name for tag in DATETIME_TAGS)
+        for name in names
+    ):
+        return list(
+            check_and_format_names_cached(
+                tuple(names),
+                prefix,
+                (
+                    None
+                    if name_templates is None
+                    else tuple(name_templates.items())
+                ),
+                bypass_validation,
+            )
+        )
+
+    return format_and_validate_names(
+        names, prefix, name_templates, bypass_validation
+    )
+
+
+@lru_cache(maxsize=256)
+def check_and_format_names_cached(
+    names: Tuple[str, ...],
+    prefix: Prefix,
+    name_templates_items: Optional[Tuple],
+    bypass_validation: bool,
+) -> Tuple[str, ...]:
+    """
+    Cached `format_and_validate_names()` on hashable inputs,
+    see `check_and_format_names()`. Invalid names raise,
+    so are never cached.
+    """
+    name_templates = (
+        None if name_templates_items is None else dict(name_templates_items)
+    )
+    return tuple(
+        format_and_validate_names(
+            list(names), prefix, name_templates, bypass_validation
+        )
+    )
+
+
+def format_and_validate_names(
+    names: List[str],
+    prefix: Prefix,
+    name_templates: Optional[Dict],
+    bypass_validation: bool,
+) -> List[str]:
+    """
+    Format and validate names, see `check_and_format_names()`.
+    """
     names_to_format, reserved_keywords = [], []
     for name in names:
-        if name in canonical_reserved_keywords() or tags("*") in name:
+        if name in RESERVED_KEYWORDS_SET or tags("*") in name:
             reserved_keywords.append(name)
         else:
             names_to_format.append(name)
@@ -97,7 +162,7 @@ def format_names(names: List, prefix: Prefix) -> List[str]:
     assert prefix in ["sub", "ses"], "`prefix` must be 'sub' or 'ses'."
 
     if not isinstance(names, List) or any(
-        [not isinstance(ele, str) for ele in names]
+        not isinstance(ele, str) for ele in names
     ):
         utils.log_and_raise_error(
             f"Ensure {prefix} names are a list of strings.", TypeError
@@ -20,11 +20,8 @@ if TYPE_CHECKING:
 import warnings
 
 from datashuttle.configs import canonical_folders
-from datashuttle.utils import folders, utils
-from datashuttle.utils.custom_exceptions import (
-    ConfigError,
-    NeuroBlueprintError,
-)
+from datashuttle.utils import folders, ssh, utils
+from datashuttle.utils.custom_exceptions import NeuroBlueprintError
 
 
 def get_next_sub_or_ses(
@@ -90,7 +87,12 @@ def get_next_sub_or_ses(
         cfg, top_level_folder, sub, search_str, local_only=local_only
     )
 
-    all_folders = list(set(folder_names["local"] + folder_names["central"]))
+    if local_only:
+        all_folders = folder_names["local"]
+    else:
+        all_folders = list(
+            set(folder_names["local"] + folder_names["central"])
+        )
 
     (
         max_existing_num,
@@ -191,14 +193,15 @@ def get_max_sub_or_ses_num_and_value_length(
             )
 
         # Then get the latest existing sub or ses number in the project.
-        all_value_nums = sorted(
-            [utils.sub_or_ses_value_to_int(value) for value in all_values_str]
-        )
+        # The numbers are only sorted for display if some are skipped.
+        all_value_nums = [
+            utils.sub_or_ses_value_to_int(value) for value in all_values_str
+        ]
 
         if not utils.integers_are_consecutive(all_value_nums):
             warnings.warn(
                 f"A subject number has been skipped, "
-                f"currently used subject numbers are: {all_value_nums}",
+                f"currently used subject numbers are: {sorted(all_value_nums)}",
             )
 
         max_existing_num = max(all_value_nums)
@@ -214,15 +217,15 @@ def get_num_value_digits_from_project(
     `all_values_str` is a list of all the sub or ses values from within
     the project.
     """
-    all_num_value_digits = [len(value) for value in all_values_str]
+    all_num_value_digits = {len(value) for value in all_values_str}
 
-    if len(set(all_num_value_digits)) != 1:
+    if len(all_num_value_digits) != 1:
         utils.log_and_raise_error(
             f"The number of value digits for the {prefix} level are not "
             f"consistent. Cannot suggest a {prefix} number.",
             NeuroBlueprintError,
         )
-    num_value_digits = all_num_value_digits[0]
+    (num_value_digits,) = all_num_value_digits
 
     return num_value_digits
 
@@ -270,21 +273,12 @@ def get_existing_project_paths() -> List[Path]:
         datashuttle_path / "*"
     )
 
-    existing_project_paths = []
-    for folder_name in all_folders:
-        config_file = list(
-            (datashuttle_path / folder_name).glob("config.yaml")
-        )
-
-        if len(config_file) > 1:
-            utils.log_and_raise_error(
-                f"There are two config files in project"
-                f"{folder_name} at path {datashuttle_path}. There "
-                f"should only ever be one config per project. ",
-                ConfigError,
-            )
-        elif len(config_file) == 1:
-            existing_project_paths.append(datashuttle_path / folder_name)
+    # One stat per folder, rather than listing each folder.
+    existing_project_paths = [
+        datashuttle_path / folder_name
+        for folder_name in all_folders
+        if (datashuttle_path / folder_name / "config.yaml").is_file()
+    ]
 
     existing_project_paths.sort(key=os.path.getmtime, reverse=True)
 
@@ -314,28 +308,31 @@ def get_all_sub_and_ses_names(
         If `True, only get names from `local_path`, otherwise from
         `local_path` and `central_path`.
     """
-    sub_folder_names = folders.search_project_for_sub_or_ses_names(
-        cfg, top_level_folder, None, "sub-*", local_only
-    )
-
-    if local_only:
-        all_sub_folder_names = sub_folder_names["local"]
-    else:
-        all_sub_folder_names = (
-            sub_folder_names["local"] + sub_folder_names["central"]
-        )
-
-    all_ses_folder_names = {}
-    for sub in all_sub_folder_names:
-        ses_folder_names = folders.search_project_for_sub_or_ses_names(
-            cfg, top_level_folder, sub, "ses-*", local_only
+    # Searches of central over SSH share one connection,
+    # which is closed once all names are found.
+    with ssh.SFTPClientPool(cfg, verbose=False) as sftp_pool:
+        sub_folder_names = folders.search_project_for_sub_or_ses_names(
+            cfg, top_level_folder, None, "sub-*", local_only, sftp_pool
         )
 
         if local_only:
-            all_ses_folder_names[sub] = ses_folder_names["local"]
+            all_sub_folder_names = sub_folder_names["local"]
         else:
-            all_ses_folder_names[sub] = (
-                ses_folder_names["local"] + ses_folder_names["central"]
+            all_sub_folder_names = (
+                sub_folder_names["local"] + sub_folder_names["central"]
             )
 
+        all_ses_folder_names = {}
+        for sub in all_sub_folder_names:
+            ses_folder_names = folders.search_project_for_sub_or_ses_names(
+                cfg, top_level_folder, sub, "ses-*", local_only, sftp_pool
+            )
+
+            if local_only:
+                all_ses_folder_names[sub] = ses_folder_names["local"]
+            else:
+                all_ses_folder_names[sub] = (
+                    ses_folder_names["local"] + ses_folder_names["central"]
+                )
+
     return {"sub": all_sub_folder_names, "ses": all_ses_folder_names}
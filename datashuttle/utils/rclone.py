@@ -1,31 +1,61 @@
+import os
 import subprocess
+import tempfile
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import Dict, List, Literal
+from typing import Callable, Dict, List, Literal, Optional
 
 from datashuttle.configs.config_class import Configs
 from datashuttle.utils import utils
 from datashuttle.utils.custom_types import TopLevelFolder
 
 
-def call_rclone(command: str, pipe_std: bool = False) -> CompletedProcess:
+def call_rclone(
+    command: List[str],
+    pipe_std: bool = False,
+    handle_stderr_line: Optional[Callable[[str], None]] = None,
+) -> CompletedProcess:
     """
     Call rclone with the specified command. Current mode is double-verbose.
     Return the completed process from subprocess.
 
+    The command is run directly (not through a shell), so
+    arguments (e.g. paths with spaces) must not be quoted.
+
     Parameters
     ----------
-    command: Rclone command to be run
+    command: Rclone command to be run, as a list of arguments
+        (e.g. ["config", "file"]).
 
     pipe_std: if True, do not output anything to stdout.
+
+    handle_stderr_line: if given, stdout is discarded and each line of
+        stderr is passed to this function as rclone writes it, rather than
+        being stored on the returned process. Use this for long-running
+        commands (e.g. transfers) so their output is not held in memory.
     """
-    command = "rclone " + command
-    if pipe_std:
+    command = ["rclone"] + command
+    if handle_stderr_line is not None:
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+        ) as process:
+            assert process.stderr is not None
+            for line in process.stderr:
+                handle_stderr_line(line.rstrip("\n"))
+
+        output: CompletedProcess = CompletedProcess(
+            command, process.returncode
+        )
+
+    elif pipe_std:
         output = subprocess.run(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
     else:
-        output = subprocess.run(command, shell=True)
+        output = subprocess.run(command)
 
     return output
 
@@ -52,6 +82,9 @@ def setup_rclone_config_for_local_filesystem(
     For SSH, this contains information for
     connecting to central with SSH.
 
+    As the config holds no settings, it is not
+    created again if it already exists.
+
     Parameters
     ----------
 
@@ -61,12 +94,30 @@ def setup_rclone_config_for_local_filesystem(
 
     log : whether to log, if True logger must already be initialised.
     """
-    call_rclone(f"config create {rclone_config_name} local", pipe_std=True)
+    if rclone_config_exists(rclone_config_name):
+        return
+
+    call_rclone(
+        ["config", "create", rclone_config_name, "local"], pipe_std=True
+    )
 
     if log:
         log_rclone_config_output()
 
 
+def rclone_config_exists(rclone_config_name: str) -> bool:
+    """
+    Return `True` if a remote called `rclone_config_name` is
+    in the rclone config file (see `rclone listremotes`).
+    """
+    output = call_rclone(["listremotes"], pipe_std=True)
+
+    if output.returncode != 0:
+        return False
+
+    return f"{rclone_config_name}:" in output.stdout.decode("utf-8").split()
+
+
 def setup_rclone_config_for_ssh(
     cfg: Configs,
     rclone_config_name: str,
@@ -94,13 +145,20 @@ def setup_rclone_config_for_ssh(
     log : whether to log, if True logger must already be initialised.
     """
     call_rclone(
-        f"config create "
-        f"{rclone_config_name} "
-        f"sftp "
-        f"host {cfg['central_host_id']} "
-        f"user {cfg['central_host_username']} "
-        f"port 22 "
-        f"key_file {ssh_key_path.as_posix()}",
+        [
+            "config",
+            "create",
+            rclone_config_name,
+            "sftp",
+            "host",
+            f"{cfg['central_host_id']}",
+            "user",
+            f"{cfg['central_host_username']}",
+            "port",
+            "22",
+            "key_file",
+            ssh_key_path.as_posix(),
+        ],
         pipe_std=True,
     )
 
@@ -109,7 +167,7 @@ def setup_rclone_config_for_ssh(
 
 
 def log_rclone_config_output():
-    output = call_rclone("config file", pipe_std=True)
+    output = call_rclone(["config", "file"], pipe_std=True)
     utils.log(
         f"Successfully created rclone config. "
         f"{output.stdout.decode('utf-8')}"
@@ -121,17 +179,26 @@ def check_rclone_with_default_call() -> bool:
     Check to see whether rclone is installed.
     """
     try:
-        output = call_rclone("-h", pipe_std=True)
+        output = call_rclone(["-h"], pipe_std=True)
     except FileNotFoundError:
         return False
     return True if output.returncode == 0 else False
 
 
+# Set once rclone is found, so it is only checked for once per session.
+_RCLONE_FOUND = False
+
+
 def prompt_rclone_download_if_does_not_exist() -> None:
     """
     Check that rclone is installed. If it does not
     (e.g. first time using datashuttle) then download.
     """
+    global _RCLONE_FOUND
+
+    if _RCLONE_FOUND:
+        return
+
     if not check_rclone_with_default_call():
         raise BaseException(
             "RClone installation not found. Install by entering "
@@ -139,6 +206,8 @@ def prompt_rclone_download_if_does_not_exist() -> None:
             " conda install -c conda-forge rclone"
         )
 
+    _RCLONE_FOUND = True
+
 
 # -----------------------------------------------------------------------------
 # Transfer
@@ -151,6 +220,7 @@ def transfer_data(
     top_level_folder: TopLevelFolder,
     include_list: List[str],
     rclone_options: Dict,
+    handle_output_line: Callable[[str], None],
 ) -> subprocess.CompletedProcess:
     """
     Transfer data by making a call to Rclone.
@@ -169,11 +239,18 @@ def transfer_data(
         The top-level-folder to transfer files within.
 
     include_list : List[str]
-        A list of filepaths to include in the transfer
+        A list of rclone filter patterns (relative to the top-level
+        folder) to include in the transfer. These are passed to rclone
+        through a file with `--include-from`, so the command line length
+        does not grow with the number of paths.
 
     rclone_options : Dict
         A list of options to pass to Rclone's copy function.
         see `cfg.make_rclone_transfer_options()`.
+
+    handle_output_line : Callable[[str], None]
+        Called with each line of rclone output (e.g. to log it)
+        as the transfer proceeds.
     """
     assert upload_or_download in [
         "upload",
@@ -186,27 +263,88 @@ def transfer_data(
         "central", top_level_folder
     ).as_posix()
 
-    extra_arguments = handle_rclone_arguments(rclone_options, include_list)
+    include_file = write_include_file(include_list)
 
-    if upload_or_download == "upload":
-        output = call_rclone(
-            f"{rclone_args('copy')} "
-            f'"{local_filepath}" "{cfg.get_rclone_config_name()}:'
-            f'{central_filepath}" {extra_arguments}',
-            pipe_std=True,
-        )
+    utils.log(
+        "Passing --include patterns to rclone with --include-from:\n"
+        + "\n".join(include_list)
+    )
 
-    elif upload_or_download == "download":
-        output = call_rclone(
-            f"{rclone_args('copy')} "
-            f'"{cfg.get_rclone_config_name()}:'
-            f'{central_filepath}" "{local_filepath}"  {extra_arguments}',
-            pipe_std=True,
+    try:
+        extra_arguments = handle_rclone_arguments(
+            rclone_options, ["--include-from", include_file]
         )
 
+        central_remote = f"{cfg.get_rclone_config_name()}:{central_filepath}"
+
+        if upload_or_download == "upload":
+            output = call_rclone(
+                [rclone_args("copy"), local_filepath, central_remote]
+                + extra_arguments,
+                handle_stderr_line=handle_output_line,
+            )
+
+        elif upload_or_download == "download":
+            output = call_rclone(
+                [rclone_args("copy"), central_remote, local_filepath]
+                + extra_arguments,
+                handle_stderr_line=handle_output_line,
+            )
+    finally:
+        os.remove(include_file)
+
     return output
 
 
+def write_include_file(include_list: List[str]) -> str:
+    """
+    Write rclone filter patterns to a temporary file, one per
+    line, for use with `--include-from`. The caller is responsible
+    for deleting the file.
+
+    rclone treats lines starting with "#" or ";" as comments,
+    so these characters are escaped when they start a pattern.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False, encoding="utf-8"
+    ) as file:
+        for pattern in include_list:
+            if pattern[:1] in ("#", ";"):
+                pattern = "\\" + pattern
+            file.write(f"{pattern}\n")
+
+    return Path(file.name).as_posix()
+
+
+def get_central_folder_tree_listing(
+    cfg: Configs, base_folder: Path, max_depth: int
+) -> Optional[str]:
+    """
+    Recursively list the contents of `base_folder` on central,
+    up to `max_depth` levels deep, with a single call to
+    `rclone lsf`. Each line of the output is a path relative
+    to `base_folder`, with folders ending in "/".
+
+    Returns `None` if the listing failed (e.g. the
+    folder does not exist on central).
+    """
+    output = call_rclone(
+        [
+            "lsf",
+            "-R",
+            "--max-depth",
+            str(max_depth),
+            f"{cfg.get_rclone_config_name()}:{base_folder.as_posix()}",
+        ],
+        pipe_std=True,
+    )
+
+    if output.returncode != 0:
+        return None
+
+    return output.stdout.decode("utf-8")
+
+
 def get_local_and_central_file_differences(
     cfg: Configs,
     top_level_folders_to_check: List[TopLevelFolder],
@@ -300,10 +438,13 @@ def perform_rclone_check(
     ).parent.as_posix()
 
     output = call_rclone(
-        f'{rclone_args("check")} '
-        f'"{local_filepath}" '
-        f'"{cfg.get_rclone_config_name()}:{central_filepath}"'
-        f" --combined -",
+        [
+            rclone_args("check"),
+            local_filepath,
+            f"{cfg.get_rclone_config_name()}:{central_filepath}",
+            "--combined",
+            "-",
+        ],
         pipe_std=True,
     )
 
@@ -312,9 +453,9 @@ def perform_rclone_check(
 
 def handle_rclone_arguments(
     rclone_options: Dict, include_list: List[str]
-) -> str:
+) -> List[str]:
     """
-    Construct the extra arguments to pass to RClone,
+    Construct the list of extra arguments to pass to RClone,
     """
     extra_arguments_list = []
 
@@ -337,43 +478,35 @@ def handle_rclone_arguments(
     if rclone_options["dry_run"]:
         extra_arguments_list += [rclone_args("dry_run")]
 
+    # Filter on modification time so that rclone can skip
+    # older files without checking them against the target.
+    if rclone_options.get("max_age") is not None:
+        extra_arguments_list += [
+            rclone_args("max_age"),
+            rclone_options["max_age"],
+        ]
+
     extra_arguments_list += include_list
 
-    extra_arguments = " ".join(extra_arguments_list)
+    return extra_arguments_list
 
-    return extra_arguments
+
+# The rclone command or flag for each argument name used in datashuttle.
+_RCLONE_ARGS = {
+    "dry_run": "--dry-run",
+    "copy": "copy",
+    "never_overwrite": "--ignore-existing",
+    "if_source_newer_overwrite": "--update",
+    "progress": "--progress",
+    "check": "check",
+    "max_age": "--max-age",
+}
 
 
 def rclone_args(name: str) -> str:
     """
     Central function to hold rclone commands
     """
-    valid_names = [
-        "dry_run",
-        "copy",
-        "never_overwrite",
-        "if_source_newer_overwrite",
-        "progress",
-        "check",
-    ]
-    assert name in valid_names, f"`name` must be in: {valid_names}"
-
-    if name == "dry_run":
-        arg = "--dry-run"
-
-    if name == "copy":
-        arg = "copy"
-
-    if name == "never_overwrite":
-        arg = "--ignore-existing"
-
-    if name == "if_source_newer_overwrite":
-        arg = "--update"
-
-    if name == "progress":
-        arg = "--progress"
-
-    if name == "check":
-        arg = "check"
+    assert name in _RCLONE_ARGS, f"`name` must be in: {list(_RCLONE_ARGS)}"
 
-    return arg
+    return _RCLONE_ARGS[name]
@@ -3,16 +3,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import paramiko
+
     from datashuttle.configs.config_class import Configs
 
-import fnmatch
-import getpass
+import os
 import stat
 import sys
+import threading
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
-
-import paramiko
+from typing import Any, Iterator, List, Optional, Tuple
 
 from datashuttle.utils import utils
 
@@ -29,6 +31,8 @@ def connect_client_core(
     cfg: Configs,
     password: Optional[str] = None,
 ):
+    import paramiko
+
     client.get_host_keys().load(cfg.hostkeys_path.as_posix())
     client.set_missing_host_key_policy(paramiko.RejectPolicy())
 
@@ -53,7 +57,9 @@ def add_public_key_to_central_authorized_keys(
     """
     generate_and_write_ssh_key(cfg.ssh_key_path)
 
-    key = paramiko.RSAKey.from_private_key_file(cfg.ssh_key_path.as_posix())
+    key = load_private_key(cfg.ssh_key_path)
+
+    import paramiko
 
     client: paramiko.SSHClient
     with paramiko.SSHClient() as client:
@@ -73,8 +79,38 @@ def add_public_key_to_central_authorized_keys(
 
 
 def generate_and_write_ssh_key(ssh_key_path: Path) -> None:
+    import paramiko
+
     key = paramiko.RSAKey.generate(4096)
     key.write_private_key_file(ssh_key_path.as_posix())
+    read_private_key_file.cache_clear()
+
+
+def load_private_key(ssh_key_path: Path) -> paramiko.RSAKey:
+    """
+    Load the RSA private key at `ssh_key_path`. Parsing the key
+    is slow, so the key is cached until the file is modified
+    (see `read_private_key_file()`).
+    """
+    file_stat = os.stat(ssh_key_path)
+
+    return read_private_key_file(
+        ssh_key_path.as_posix(), file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+
+@lru_cache(maxsize=8)
+def read_private_key_file(
+    file_path: str, mtime_ns: int, size: int
+) -> paramiko.RSAKey:
+    """
+    Parse the private key file. The modification time and size
+    are only used as part of the cache key, so a changed
+    file is read again.
+    """
+    import paramiko
+
+    return paramiko.RSAKey.from_private_key_file(file_path)
 
 
 def get_remote_server_key(central_host_id: str):
@@ -82,6 +118,8 @@ def get_remote_server_key(central_host_id: str):
     Get the remove server host key for validation before
     connection.
     """
+    import paramiko
+
     transport: paramiko.Transport
     with paramiko.Transport(central_host_id) as transport:
         transport.connect()
@@ -90,6 +128,8 @@ def get_remote_server_key(central_host_id: str):
 
 
 def save_hostkey_locally(key, central_host_id, hostkeys_path) -> None:
+    import paramiko
+
     client = paramiko.SSHClient()
     client.get_host_keys().add(central_host_id, key.get_name(), key)
     client.get_host_keys().save(hostkeys_path.as_posix())
@@ -147,6 +187,8 @@ def setup_ssh_key(
             "Please enter your password. Characters will not be hidden: "
         )
     else:
+        import getpass
+
         password = getpass.getpass(
             "Please enter password to your central host to add the public key. "
             "You will not have to enter your password again."
@@ -239,11 +281,110 @@ def verify_ssh_central_host(
 # -----------------------------------------------------------------------------
 
 
+class SFTPClientPool:
+    """
+    SFTP channels on a single connection to the central server,
+    shared by the searches of one operation (e.g. building a transfer
+    list) so they do not each pay for a new handshake. The connection
+    is made on first use and closed with `close()` (or on leaving the
+    `with` block), once the operation is finished.
+
+    A single SFTP channel should not be used concurrently, so each
+    search takes an idle channel from the pool (or opens a new one)
+    and returns it when done.
+
+    Parameters
+    -----------
+
+    cfg : see connect_client_with_logging()
+
+    verbose : If `True`, print a message when the connection is made.
+    """
+
+    def __init__(self, cfg: Configs, verbose: bool = True):
+        self.cfg = cfg
+        self.verbose = verbose
+
+        self._lock = threading.Lock()
+        self._client: Optional[paramiko.SSHClient] = None
+        self._idle_sftp_clients: List[paramiko.sftp_client.SFTPClient] = []
+
+    def __enter__(self) -> SFTPClientPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @contextmanager
+    def sftp_client(self) -> Iterator[paramiko.sftp_client.SFTPClient]:
+        """
+        Context manager providing an SFTP client connected to the
+        central server, connecting on first use. The channel is
+        returned to the pool on exit.
+        """
+        with self._lock:
+            if self._client is None:
+                import paramiko
+
+                client = paramiko.SSHClient()
+                try:
+                    connect_client_with_logging(
+                        client,
+                        self.cfg,
+                        message_on_sucessful_connection=self.verbose,
+                    )
+                except BaseException:
+                    client.close()
+                    raise
+
+                self._client = client
+
+            client = self._client
+            sftp = (
+                self._idle_sftp_clients.pop()
+                if self._idle_sftp_clients
+                else None
+            )
+
+        if sftp is None:
+            sftp = client.open_sftp()
+
+        try:
+            yield sftp
+        except BaseException:
+            sftp.close()
+            raise
+
+        # Only returned to the pool if the connection
+        # was not closed while the channel was in use.
+        with self._lock:
+            return_to_pool = self._client is client
+            if return_to_pool:
+                self._idle_sftp_clients.append(sftp)
+
+        if not return_to_pool:
+            sftp.close()
+
+    def close(self) -> None:
+        """
+        Close the connection along with its idle SFTP channels.
+        """
+        with self._lock:
+            for sftp in self._idle_sftp_clients:
+                sftp.close()
+            self._idle_sftp_clients = []
+
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
 def search_ssh_central_for_folders(
     search_path: Path,
     search_prefix: str,
     cfg: Configs,
     verbose: bool = True,
+    sftp_pool: Optional[SFTPClientPool] = None,
 ) -> Tuple[List[Any], List[Any]]:
     """
     Search for the search prefix in the search path over SSH.
@@ -260,21 +401,23 @@ def search_ssh_central_for_folders(
 
     verbose : If `True`, if a search folder cannot be found, a message
               will be printed with the un-found path.
-    """
-    client: paramiko.SSHClient
-    with paramiko.SSHClient() as client:
-        connect_client_with_logging(
-            client, cfg, message_on_sucessful_connection=verbose
-        )
 
-        sftp = client.open_sftp()
-
-        all_folder_names, all_filenames = get_list_of_folder_names_over_sftp(
-            sftp,
-            search_path,
-            search_prefix,
-            verbose,
-        )
+    sftp_pool : if given, the search uses a channel on this pool's
+        connection. Otherwise, a connection is made for this search only.
+    """
+    with ExitStack() as stack:
+        if sftp_pool is None:
+            sftp_pool = stack.enter_context(SFTPClientPool(cfg, verbose))
+
+        with sftp_pool.sftp_client() as sftp:
+            all_folder_names, all_filenames = (
+                get_list_of_folder_names_over_sftp(
+                    sftp,
+                    search_path,
+                    search_prefix,
+                    verbose,
+                )
+            )
 
     return all_folder_names, all_filenames
 
@@ -293,7 +436,7 @@ def get_list_of_folder_names_over_sftp(
     ----------
 
     stfp : connected paramiko stfp object
-        (see search_ssh_central_for_folders())
+        (see SFTPClientPool.sftp_client())
 
     search_path : path to search for folders in
 
@@ -303,12 +446,14 @@ def get_list_of_folder_names_over_sftp(
     verbose : If `True`, if a search folder cannot be found, a message
           will be printed with the un-found path.
     """
+    name_matches = utils.get_name_matcher(search_prefix)
+
     all_folder_names = []
     all_filenames = []
     try:
         for file_or_folder in sftp.listdir_attr(search_path.as_posix()):
-            if file_or_folder.st_mode is not None and fnmatch.fnmatch(
-                file_or_folder.filename, search_prefix
+            if file_or_folder.st_mode is not None and name_matches(
+                file_or_folder.filename
             ):
                 if stat.S_ISDIR(file_or_folder.st_mode):
                     all_folder_names.append(file_or_folder.filename)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import fnmatch
+import logging
+import os
 import re
 import traceback
 import warnings
-from typing import TYPE_CHECKING, Any, List, Literal, Union, overload
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    List,
+    Literal,
+    Union,
+    overload,
+)
 
 from rich import print as rich_print
 
@@ -43,8 +51,9 @@ def log_and_raise_error(message: str, exception: Any) -> None:
     """
     if ds_logger.logging_is_active():
         logger = ds_logger.get_logger()
-        logger.error(f"\n\n{' '.join(traceback.format_stack(limit=5))}")
-        logger.error(message)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"\n\n{' '.join(traceback.format_stack(limit=5))}")
+            logger.error(message)
     raise_error(message, exception)
 
 
@@ -92,8 +101,21 @@ def get_user_input(message: str) -> str:
 # -----------------------------------------------------------------------------
 
 
-def path_starts_with_base_folder(base_folder: Path, path_: Path) -> bool:
-    return path_.as_posix().startswith(base_folder.as_posix())
+@lru_cache(maxsize=64)
+def get_name_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Return a function that checks whether a name matches the
+    glob-style `pattern`, in the same way as `fnmatch.fnmatch()`.
+    The pattern is compiled once, so use this when checking
+    many names (e.g. a folder listing) against the same pattern.
+    """
+    regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+    # normcase is a no-op on case-sensitive platforms
+    if os.path.normcase("A") == "A":
+        return lambda name: regex.match(name) is not None
+
+    return lambda name: regex.match(os.path.normcase(name)) is not None
 
 
 # -----------------------------------------------------------------------------
@@ -178,7 +200,16 @@ def get_value_from_key_regexp(name: str, key: str) -> List[str]:
     e.g. sub-001_ses-312 would find
     312 for key "ses".
     """
-    return re.findall(f"{key}-(.*?)(?=_|$)", name)
+    return get_key_value_regexp(key).findall(name)
+
+
+@lru_cache(maxsize=64)
+def get_key_value_regexp(key: str) -> re.Pattern:
+    """
+    Compile the pattern that finds the value for `key` in a
+    BIDS-style name once per key, as it is used for every name.
+    """
+    return re.compile(f"{key}-(.*?)(?=_|$)")
 
 
 # -----------------------------------------------------------------------------
@@ -187,8 +218,19 @@ def get_value_from_key_regexp(name: str, key: str) -> List[str]:
 
 
 def integers_are_consecutive(list_of_ints: List[int]) -> bool:
-    diff_between_ints = diff(list_of_ints)
-    return all([diff == 1 for diff in diff_between_ints])
+    """
+    Check the integers are a run of consecutive numbers with no
+    repeats (in any order), from their min, max and number of unique
+    values. This avoids sorting and differencing the list.
+    """
+    if not list_of_ints:
+        return True
+
+    num_unique = len(set(list_of_ints))
+
+    return num_unique == len(list_of_ints) and (
+        max(list_of_ints) - min(list_of_ints) + 1 == num_unique
+    )
 
 
 def diff(x: List) -> List:
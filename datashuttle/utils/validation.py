@@ -13,6 +13,8 @@ from datashuttle.configs import canonical_folders
 from datashuttle.utils import formatting, getters, utils
 from datashuttle.utils.custom_exceptions import NeuroBlueprintError
 
+ALLOWED_CHARACTERS_REGEXP = re.compile("^[A-Za-z0-9_-]*$")
+
 # -----------------------------------------------------------------------------
 # Checking a standalone list of names
 # -----------------------------------------------------------------------------
@@ -211,7 +213,7 @@ def names_include_special_characters(
 
 
 def name_has_special_character(name: str) -> bool:
-    return not re.match("^[A-Za-z0-9_-]*$", name)
+    return not ALLOWED_CHARACTERS_REGEXP.match(name)
 
 
 def dashes_and_underscore_alternate_incorrectly(
@@ -235,7 +237,7 @@ def dashes_and_underscore_alternate_incorrectly(
         ]
 
         underscore_dash_not_interleaved = any(
-            [ele == 0 for ele in utils.diff(dashes_underscores)]
+            ele == 0 for ele in utils.diff(dashes_underscores)
         )
 
         if (
@@ -683,14 +685,11 @@ def datatypes_are_invalid(
     if isinstance(datatype, str):
         datatype = [datatype]
 
-    valid_keys = list(datatype_folders.keys())
-    if allow_all:
-        valid_keys += ["all"]
-
-    bad_datatypes = []
-    for dt in datatype:
-        if dt not in valid_keys:
-            bad_datatypes.append(dt)
+    bad_datatypes = [
+        dt
+        for dt in datatype
+        if dt not in datatype_folders and not (allow_all and dt == "all")
+    ]
 
     if bad_datatypes:
         or_all = " or 'all'" if allow_all else ""
@@ -1,5 +1,4 @@
 import builtins
-import copy
 
 from datashuttle.utils import rclone, ssh
 
@@ -9,14 +8,15 @@ def setup_project_for_ssh(
 ):
     """
     Set up the project configs to use SSH connection
-    to central
+    to central. The configs are updated together so
+    they are only checked and saved once.
     """
     project.update_config_file(
         central_path=central_path,
+        central_host_id=central_host_id,
+        central_host_username=central_host_username,
+        connection_method="ssh",
     )
-    project.update_config_file(central_host_id=central_host_id)
-    project.update_config_file(central_host_username=central_host_username)
-    project.update_config_file(connection_method="ssh")
 
     rclone.setup_rclone_config_for_ssh(
         project.cfg,
@@ -32,14 +32,14 @@ def setup_mock_input(input_):
     monkeypatch.setattr('builtins.input', lambda _: "n")
     i.e. pdb went deep into some unrelated code stack
     """
-    orig_builtin = copy.deepcopy(builtins.input)
+    orig_builtin = builtins.input
     builtins.input = lambda _: input_  # type: ignore
     return orig_builtin
 
 
 def restore_mock_input(orig_builtin):
     """
-    orig_builtin: the copied, original builtins.input
+    orig_builtin: the original builtins.input
     """
     builtins.input = orig_builtin
 
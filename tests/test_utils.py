@@ -45,11 +45,7 @@ def setup_project_default_configs(
 
     project.make_config_file(**default_configs)
 
-    rclone.setup_rclone_config_for_ssh(
-        project.cfg,
-        project.cfg.get_rclone_config_name("ssh"),
-        project.cfg.ssh_key_path,
-    )
+    setup_ssh_rclone_config_once(project)
 
     warnings.filterwarnings("default")
 
@@ -104,6 +100,16 @@ def delete_all_folders_in_local_path(project):
         shutil.rmtree(project.cfg["local_path"])
 
 
+def clear_datatype_folders_caches():
+    """
+    Clear the cached canonical datatype folders (and the views
+    derived from them) so they are rebuilt on next use.
+    """
+    canonical_folders.get_datatype_folders.cache_clear()
+    canonical_folders.get_datatype_folders_by_level.cache_clear()
+    canonical_folders.get_datatype_folders_items.cache_clear()
+
+
 def delete_all_folders_in_project_path(project, local_or_central):
     """"""
     folder = f"{local_or_central}_path"
@@ -119,6 +125,34 @@ def delete_all_folders_in_project_path(project, local_or_central):
         shutil.rmtree(project.cfg[folder])
 
 
+# The SSH rclone configs made during the test session. These are
+# stored in rclone's config file, which is not cleared between tests.
+SSH_RCLONE_CONFIGS = set()
+
+
+def setup_ssh_rclone_config_once(project):
+    """
+    Set up the SSH rclone config for the project, unless an
+    identical config was already made during the test session.
+    Making the config calls rclone, which dominates project setup.
+    """
+    rclone_config_name = project.cfg.get_rclone_config_name("ssh")
+
+    config_key = (
+        rclone_config_name,
+        project.cfg["central_host_id"],
+        project.cfg["central_host_username"],
+        project.cfg.ssh_key_path,
+    )
+    if config_key in SSH_RCLONE_CONFIGS:
+        return
+
+    rclone.setup_rclone_config_for_ssh(
+        project.cfg, rclone_config_name, project.cfg.ssh_key_path, log=False
+    )
+    SSH_RCLONE_CONFIGS.add(config_key)
+
+
 def delete_project_if_it_exists(project_name):
     """"""
     config_path, _ = canonical_folders.get_project_datashuttle_path(
@@ -128,6 +162,13 @@ def delete_project_if_it_exists(project_name):
         ds_logger.close_log_filehandler()
         shutil.rmtree(config_path)
 
+        # The local filesystem rclone config is only made if it does
+        # not exist, so it is deleted along with the project.
+        rclone.call_rclone(
+            ["config", "delete", f"central_{project_name}_local_filesystem"],
+            pipe_std=True,
+        )
+
 
 def setup_project_fixture(tmp_path, test_project_name, project_type="full"):
     """
@@ -636,28 +677,37 @@ def check_working_top_level_folder_only_exists(
     )
 
     # Check other top-level folders are not made
-    unused_folders = canonical_folders.get_top_level_folders()
+    unused_folders = list(canonical_folders.get_top_level_folders())
     unused_folders.remove(folder_name)
 
     for folder in unused_folders:
         assert not (base_path_to_check.parent / folder).is_dir()
 
 
+def get_log_files(logging_path):
+    """
+    Get the paths of all log files in `logging_path`
+    (an empty list if the folder does not exist).
+    """
+    if not os.path.isdir(logging_path):
+        return []
+
+    with os.scandir(logging_path) as it:
+        return [entry.path for entry in it if entry.name.endswith(".log")]
+
+
 def read_log_file(logging_path):
-    log_filepath = list(glob.glob(str(logging_path / "*.log")))
+    log_filepath = get_log_files(logging_path)
 
     assert len(log_filepath) == 1, (
         f"there should only be one log " f"in log output path {logging_path}"
     )
     log_filepath = log_filepath[0]
 
-    with open(log_filepath, "r") as file:
-        log = file.read()
-
-    return log
+    return Path(log_filepath).read_text()
 
 
 def delete_log_files(logging_path):
     ds_logger.close_log_filehandler()
-    for log in glob.glob((str(logging_path / "*.log"))):
+    for log in get_log_files(logging_path):
         os.remove(log)
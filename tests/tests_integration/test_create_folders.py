@@ -14,6 +14,18 @@ from datashuttle.configs.canonical_tags import tags
 
 class TestMakeFolders(BaseTest):
 
+    @pytest.fixture(scope="function")
+    def clear_datatype_folders_caches(self):
+        """
+        Clear the cached datatype folders before and after the test,
+        for tests that monkeypatch `get_datatype_folders()`. Request
+        this before `monkeypatch` so the caches are cleared after
+        the patch is undone.
+        """
+        test_utils.clear_datatype_folders_caches()
+        yield
+        test_utils.clear_datatype_folders_caches()
+
     @pytest.mark.parametrize("project", ["local", "full"], indirect=True)
     def test_generate_folders_default_ses(self, project):
         """
@@ -118,16 +130,17 @@ class TestMakeFolders(BaseTest):
         )
 
     @pytest.mark.parametrize("project", ["local", "full"], indirect=True)
-    def test_custom_folder_names(self, project, monkeypatch):
+    def test_custom_folder_names(
+        self, project, clear_datatype_folders_caches, monkeypatch
+    ):
         """
         Change folder names to custom (non-default) and
         ensure they are made correctly.
         """
-        new_name_datafolders = canonical_folders.get_datatype_folders()
-        new_name_datafolders["ephys"].name = "change_ephys"
-        new_name_datafolders["behav"].name = "change_behav"
-        new_name_datafolders["anat"].name = "change_anat"
-        new_name_datafolders["funcimg"].name = "change_funcimg"
+        new_name_datafolders = {
+            key: folder._replace(name=f"change_{key}")
+            for key, folder in canonical_folders.get_datatype_folders().items()
+        }
 
         def new_name_func():
             return new_name_datafolders
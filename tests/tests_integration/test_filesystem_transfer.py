@@ -689,6 +689,45 @@ class TestFileTransfer(BaseTest):
 
         assert len(list(project.cfg["central_path"].glob("*"))) == 0
 
+    def test_max_age(self, project):
+        """
+        Check that only files modified within `max_age`
+        are transferred.
+        """
+        old_file_path, central_old_file_path = (
+            self.get_paths_to_a_local_and_central_file(project, "rawdata")
+        )
+        new_file_path = old_file_path.parent / "new_file.txt"
+
+        test_utils.write_file(old_file_path, contents="old contents")
+        test_utils.write_file(new_file_path, contents="new contents")
+
+        ten_days_ago = time.time() - 10 * 24 * 60 * 60
+        os.utime(old_file_path, (ten_days_ago, ten_days_ago))
+
+        project.upload_rawdata(max_age="1d")
+
+        assert not central_old_file_path.is_file()
+        assert (central_old_file_path.parent / "new_file.txt").is_file()
+
+    @pytest.mark.parametrize("max_age", ["1d", "1h30m", "2024-01-31"])
+    def test_max_age_formats(self, project, max_age):
+        """
+        Check durations and dates are accepted as `max_age`.
+        """
+        project.upload_rawdata(max_age=max_age, dry_run=True)
+
+    @pytest.mark.parametrize("max_age", ["one day", "1 d", "31-01-2024"])
+    def test_max_age_bad_format(self, project, max_age):
+        """
+        Check `max_age` in a format rclone does not
+        accept raises an error before transfer.
+        """
+        with pytest.raises(ValueError) as e:
+            project.upload_rawdata(max_age=max_age)
+
+        assert f"`max_age` '{max_age}' not recognised" in str(e.value)
+
     @pytest.mark.parametrize("top_level_folder", ["rawdata", "derivatives"])
     @pytest.mark.parametrize("upload_or_download", ["upload", "download"])
     @pytest.mark.parametrize("transfer_file", [True, False])
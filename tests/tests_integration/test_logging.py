@@ -1,4 +1,3 @@
-import glob
 import logging
 import os
 import re
@@ -15,6 +14,8 @@ from datashuttle.utils.custom_exceptions import (
     NeuroBlueprintError,
 )
 
+LOG_FILENAME_REGEXP = re.compile(r"\d{8}T\d{6}_update-config-file\.log")
+
 
 class TestLogging:
 
@@ -144,14 +145,13 @@ class TestLogging:
         """
         project.update_config_file(central_host_id="test_id")
 
-        log_search = list(project.cfg.logging_path.glob("*.log"))
+        log_search = test_utils.get_log_files(project.cfg.logging_path)
         assert (
             len(log_search) == 1
         ), "should only be 1 log in this test environment."
-        log_filename = log_search[0].name
+        log_filename = Path(log_search[0]).name
 
-        regex = re.compile(r"\d{8}T\d{6}_update-config-file.log")
-        assert re.search(regex, log_filename) is not None
+        assert LOG_FILENAME_REGEXP.search(log_filename) is not None
 
     def test_logs_make_config_file(self, clean_project_name, tmp_path):
         """"""
@@ -363,12 +363,10 @@ class TestLogging:
 
         # After a config file is made, check that the logs are found in
         # the passed `local_path`.
-        local_path_search = (
-            project.cfg["local_path"] / ".datashuttle" / "logs" / "*.log"
-        ).as_posix()
-
-        tmp_path_logs = list(glob.glob(str(project._temp_log_path / "*.log")))
-        project_path_logs = list(glob.glob(local_path_search))
+        tmp_path_logs = test_utils.get_log_files(project._temp_log_path)
+        project_path_logs = test_utils.get_log_files(
+            project.cfg["local_path"] / ".datashuttle" / "logs"
+        )
 
         assert len(tmp_path_logs) == 0
         assert len(project_path_logs) == 1
@@ -398,16 +396,12 @@ class TestLogging:
 
         # Because an error was raised, the log will stay in the
         # temp log folder. We clear it and check it is deleted.
-        stored_logs = list(
-            glob.glob((project._temp_log_path / "*.log").as_posix())
-        )
+        stored_logs = test_utils.get_log_files(project._temp_log_path)
         assert len(stored_logs) == 1
 
         project._clear_temp_log_path()
 
-        stored_logs = list(
-            glob.glob((project._temp_log_path / "*.log").as_posix())
-        )
+        stored_logs = test_utils.get_log_files(project._temp_log_path)
         assert len(stored_logs) == 0
 
     # ----------------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from textual.widgets._tabbed_content import ContentTab
 from datashuttle.configs import canonical_folders
 from datashuttle.tui.screens.project_manager import ProjectManagerScreen
 from datashuttle.tui.screens.project_selector import ProjectSelectorScreen
+from datashuttle.tui.tabs.create_folders import CreateFoldersTab
 
 
 class TuiBase:
@@ -99,7 +100,7 @@ class TuiBase:
         await self.scroll_to_click_pause(pilot, id)
         pilot.app.screen.query_one(id).value = ""
         await pilot.press(*value)
-        await pilot.pause()
+        await self.pause_for_validation(pilot)
 
     async def setup_existing_project_create_tab_filled_sub_and_ses(
         self, pilot, project_name, create_folders=False
@@ -129,6 +130,15 @@ class TuiBase:
         """
         for _ in range(2):
             await self.scroll_to_click_pause(pilot, id, control=control)
+        await self.pause_for_validation(pilot)
+
+    async def pause_for_validation(self, pilot):
+        """
+        Create tab subject and session inputs are validated
+        once they have not changed for a short delay, wait
+        for this to run.
+        """
+        await pilot.pause(CreateFoldersTab.validation_delay + 0.1)
 
     async def reload_tree_nodes(self, pilot, id, num_nodes):
         """
@@ -1,9 +1,14 @@
+import fnmatch
 import re
 
 import pytest
+import test_utils
 
+from datashuttle.configs import canonical_configs, canonical_folders
 from datashuttle.configs.canonical_tags import tags
-from datashuttle.utils import formatting, getters, utils
+from datashuttle.configs.config_class import Configs
+from datashuttle.utils import folders, formatting, getters, utils
+from datashuttle.utils.custom_exceptions import ConfigError
 
 
 class TestUnit:
@@ -137,6 +142,21 @@ class TestUnit:
             assert utils.num_leading_zeros("sub-" + "1".zfill(i + 1)) == i
             assert utils.num_leading_zeros("ses-" + "1".zfill(i + 1)) == i
 
+    @pytest.mark.parametrize(
+        "ints, consecutive",
+        [
+            ([], True),
+            ([5], True),
+            ([1, 2, 3], True),
+            ([3, 1, 2], True),
+            ([1, 2, 4], False),
+            ([1, 1, 2], False),
+            ([1, 2, 2, 3], False),
+        ],
+    )
+    def test_integers_are_consecutive(self, ints, consecutive):
+        assert utils.integers_are_consecutive(ints) is consecutive
+
     # Test getting max sub or ses num from list
     # -------------------------------------------------------------------------
 
@@ -247,6 +267,261 @@ class TestUnit:
         assert max_num == 11
         assert num_digits == 2
 
+    def test_datatype_folders_are_cached(self):
+        """
+        Check `get_datatype_folders()` returns the same object
+        across calls until its cache is cleared.
+        """
+        first = canonical_folders.get_datatype_folders()
+        assert canonical_folders.get_datatype_folders() is first
+
+        first_items = canonical_folders.get_datatype_folders_items()
+        assert first_items == tuple(first.items())
+        assert canonical_folders.get_datatype_folders_items() is first_items
+
+        test_utils.clear_datatype_folders_caches()
+
+        rebuilt = canonical_folders.get_datatype_folders()
+        assert rebuilt is not first
+        assert list(rebuilt.keys()) == list(first.keys())
+        assert canonical_folders.get_datatype_folders_items() == tuple(
+            rebuilt.items()
+        )
+
+    def test_datatype_folders_by_level(self):
+        """
+        Check the level partition holds every datatype folder
+        exactly once, under the level it is made at.
+        """
+        by_level = canonical_folders.get_datatype_folders_by_level()
+        all_folders = canonical_folders.get_datatype_folders().values()
+
+        assert sorted(by_level.keys()) == ["ses", "sub"]
+        assert sum(len(folders) for folders in by_level.values()) == len(
+            all_folders
+        )
+        for level, level_folders in by_level.items():
+            assert all(folder.level == level for folder in level_folders)
+
+    def test_project_datashuttle_path(self):
+        """
+        Check the project paths are within the datashuttle path,
+        and unpack as (base path, temp logs path).
+        """
+        base_path, temp_logs_path = (
+            canonical_folders.get_project_datashuttle_path("my_project")
+        )
+
+        assert (
+            base_path
+            == canonical_folders.get_datashuttle_path() / "my_project"
+        )
+        assert temp_logs_path == base_path / "temp_logs"
+
+    def test_check_and_format_names_is_cached(self):
+        """
+        Check formatted names are cached, except for names
+        with date / time tags and names not passed as a list.
+        """
+        formatting.check_and_format_names_cached.cache_clear()
+
+        for _ in range(2):
+            assert formatting.check_and_format_names(
+                ["001", "sub-002"], "sub"
+            ) == ["sub-001", "sub-002"]
+
+        assert formatting.check_and_format_names_cached.cache_info().hits == 1
+
+        formatting.check_and_format_names(f"001_{tags('date')}", "sub")
+        formatting.check_and_format_names(("001", "sub-002"), "sub")
+        assert (
+            formatting.check_and_format_names_cached.cache_info().currsize == 1
+        )
+
+    def test_process_glob_to_find_datatype_folders(self):
+        """
+        Check only datatype folders are found, matched on the
+        folder name (which may differ from the datatype key).
+        """
+        datatype_folders = dict(canonical_folders.get_datatype_folders())
+        datatype_folders["behav"] = datatype_folders["behav"]._replace(
+            name="behaviour"
+        )
+
+        results = folders.process_glob_to_find_datatype_folders(
+            ["anat", "behav", "behaviour", "ses-001", "ephys"],
+            datatype_folders,
+        )
+
+        assert list(results) == [
+            ("anat", datatype_folders["anat"]),
+            ("behav", datatype_folders["behav"]),
+            ("ephys", datatype_folders["ephys"]),
+        ]
+
+    def test_base_folder_is_cached(self, tmp_path):
+        """
+        Check base folders are cached, and rebuilt
+        when the configs are changed.
+        """
+        cfg = Configs(
+            "project",
+            tmp_path / "config.yaml",
+            {"local_path": tmp_path / "local", "central_path": None},
+        )
+
+        base_folder = cfg.get_base_folder("local", "rawdata")
+        assert base_folder == tmp_path / "local" / "rawdata"
+        assert cfg.get_base_folder("local", "rawdata") is base_folder
+
+        cfg["local_path"] = tmp_path / "new_local"
+        assert (
+            cfg.get_base_folder("local", "rawdata")
+            == tmp_path / "new_local" / "rawdata"
+        )
+
+        with pytest.raises(ValueError) as e:
+            cfg.get_base_folder("datashuttle", "rawdata")
+
+        assert "`base` not recognised" in str(e.value)
+
+    def test_build_project_path(self, tmp_path):
+        """
+        Check sub-folders are joined to the base folder, unless
+        they already start with it.
+        """
+        cfg = Configs(
+            "project",
+            tmp_path / "config.yaml",
+            {"local_path": tmp_path / "local", "central_path": None},
+        )
+        base_folder = tmp_path / "local" / "rawdata"
+
+        assert (
+            cfg.build_project_path("local", ["sub-001", "ses-001"], "rawdata")
+            == base_folder / "sub-001" / "ses-001"
+        )
+        assert (
+            cfg.build_project_path("local", "sub-001", "rawdata")
+            == base_folder / "sub-001"
+        )
+        assert (
+            cfg.build_project_path(
+                "local", (base_folder / "sub-001").as_posix(), "rawdata"
+            )
+            == base_folder / "sub-001"
+        )
+
+    def test_cache_folder_searches(self, tmp_path):
+        """
+        Check searches are only served from the cache
+        when one is passed to `search_for_folders()`.
+        """
+        (tmp_path / "sub-001").mkdir()
+        search_cache = {}
+
+        def search(search_cache=None):
+            return folders.search_for_folders(
+                None, tmp_path, "local", "sub-*", search_cache=search_cache
+            )
+
+        assert search(search_cache) == (["sub-001"], [])
+
+        (tmp_path / "sub-002").mkdir()
+        assert search(search_cache) == (["sub-001"], [])
+
+        assert sorted(search()[0]) == ["sub-001", "sub-002"]
+
+    @pytest.mark.parametrize(
+        "pattern", ["sub-*", "ses-00?", "sub-[0-9]*", "*", "sub-001"]
+    )
+    def test_get_name_matcher(self, pattern):
+        """
+        Check the compiled matcher agrees with `fnmatch.fnmatch()`.
+        """
+        names = ["sub-001", "ses-001", "ses-0010", "sub-a", "", "SUB-001"]
+
+        name_matches = utils.get_name_matcher(pattern)
+
+        for name in names:
+            assert name_matches(name) == fnmatch.fnmatch(name, pattern)
+
+    def test_search_filesystem_path_for_folders(self, tmp_path):
+        """
+        Check folders and files matching the pattern are split,
+        and hidden entries are only found by a hidden pattern.
+        """
+        (tmp_path / "sub-001").mkdir()
+        (tmp_path / ".sub-002").mkdir()
+        (tmp_path / "ses-001").mkdir()
+        (tmp_path / "sub-003.txt").touch()
+
+        all_folder_names, all_filenames = (
+            folders.search_filesystem_path_for_folders(tmp_path / "sub-*")
+        )
+        assert all_folder_names == ["sub-001"]
+        assert all_filenames == ["sub-003.txt"]
+
+        hidden_results = folders.search_filesystem_path_for_folders(
+            tmp_path / ".sub-*"
+        )
+        assert hidden_results == ([".sub-002"], [])
+
+        missing_results = folders.search_filesystem_path_for_folders(
+            tmp_path / "does_not_exist" / "*"
+        )
+        assert missing_results == ([], [])
+
+    def test_add_folder_tree_listing_to_search_cache(self, tmp_path):
+        """
+        Check a recursive rclone listing is split into per-folder
+        listings, and that folders at `max_depth` (which are not
+        fully listed) are not cached.
+        """
+        listing = (
+            "a.txt\nsub-001/\nsub-001/ses-001/\n"
+            "sub-001/ses-001/ephys/\nsub-001/ses-001/notes.txt\n"
+        )
+
+        search_cache = {}
+        folders.add_folder_tree_listing_to_search_cache(
+            search_cache, listing, tmp_path, "central", max_depth=3
+        )
+
+        assert sorted(key[1] for key in search_cache) == [
+            tmp_path.as_posix(),
+            (tmp_path / "sub-001").as_posix(),
+            (tmp_path / "sub-001" / "ses-001").as_posix(),
+        ]
+
+        ses_path = tmp_path / "sub-001" / "ses-001"
+        assert folders.search_for_folders(
+            None, ses_path, "central", "*", search_cache=search_cache
+        ) == (["ephys"], ["notes.txt"])
+        assert folders.search_for_folders(
+            None, tmp_path, "central", "sub-*", search_cache=search_cache
+        ) == (["sub-001"], [])
+
+    def test_config_type_errors_are_reported_together(self, tmp_path):
+        """
+        Check every incorrectly typed config is reported
+        in the same error.
+        """
+        config_dict = {
+            "local_path": tmp_path,
+            "central_path": None,
+            "connection_method": "ftp",
+            "central_host_id": 1,
+            "central_host_username": None,
+        }
+
+        with pytest.raises(ConfigError) as e:
+            canonical_configs.check_config_types(config_dict)
+
+        assert "'connection_method' is incorrect" in str(e.value)
+        assert "'central_host_id' is incorrect" in str(e.value)
+        assert "'local_path'" not in str(e.value)
+
     # -------------------------------------------------------------------------
     # Utils
     # -------------------------------------------------------------------------